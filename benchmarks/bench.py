@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Benchmarks nexmanager upload & download against local Nexus mock (mock_nexus.py)
+# Every step runs nexmanager in subprocess & reports wall time, server requests, transferred bytes and peak RSS
+# Synthetic projects are generated w/ fixed seed, so request counts are reproducible & can be compared w/ baseline
+from argparse import ArgumentParser
+from urllib.request import urlopen, Request
+import subprocess
+import tempfile
+import random
+import shutil
+import json
+import time
+import sys
+import os
+
+BENCH_PATH = os.path.dirname(os.path.abspath(__file__))
+MAIN_PATH = os.path.join(os.path.dirname(BENCH_PATH), "main.py")
+
+# Build params dirs of every generated project
+BUILD_DIRS = ("linux-x64-release", "windows-x64-debug")
+
+# Generated projects: files count & size range per build params dir, dirs depth, symlinks count
+# Counts & sizes are multiplied by --scale
+SCENARIOS = {
+    "small": {"files": 1000, "size": (512, 8 * 1024), "depth": 2, "symlinks": 0},
+    "huge": {"files": 2, "size": (32 * 1024 ** 2, 64 * 1024 ** 2), "depth": 1, "symlinks": 0},
+    "deep": {"files": 300, "size": (1024, 16 * 1024), "depth": 12, "symlinks": 0},
+    "symlinks": {"files": 100, "size": (1024, 4 * 1024), "depth": 2, "symlinks": 500}
+}
+
+STEPS = ("upload", "download", "noop", "recursive")
+
+# Server counters shown in report
+REQUEST_KINDS = ("components", "search", "repositories", "get", "put", "delete")
+
+# Generates project w/ deterministic content: {path}/{name}/{build params}/d0/.../f{i}.bin
+def generate_project(path: str, name: str, spec: dict, scale: float, seed: int) -> int:
+    rnd = random.Random(f"{seed}-{name}")
+    files_count = max(1, int(spec["files"] * scale))
+    symlinks_count = int(spec["symlinks"] * scale)
+    total = 0
+    for build_dir in BUILD_DIRS:
+        root = os.path.join(path, name, build_dir)
+        files = []
+        for i in range(files_count):
+            depth = rnd.randint(1, spec["depth"])
+            filedir = os.path.join(root, *(f"d{rnd.randint(0, 3)}" for _ in range(depth - 1)))
+            os.makedirs(filedir, exist_ok=True)
+            filepath = os.path.join(filedir, f"f{i}.bin")
+            size = max(1, int(rnd.randint(*spec["size"]) * min(scale, 1)))
+            # Written by chunks to keep bench RSS low, children inherit it as initial peak RSS
+            with open(filepath, "wb") as f:
+                for offset in range(0, size, 1024 * 1024):
+                    f.write(rnd.randbytes(min(1024 * 1024, size - offset)))
+            files.append(filepath)
+            total += 1
+        for i in range(symlinks_count):
+            target = rnd.choice(files)
+            link = os.path.join(os.path.dirname(target), f"l{i}.bin")
+            os.symlink(os.path.basename(target), link)
+            total += 1
+    return total
+
+# Creates workspaces: single one & tree of nested ones for recursive download
+def generate_workspaces(path: str, name: str, nested: int) -> tuple:
+    workspace = os.path.join(path, "ws", name)
+    os.makedirs(workspace)
+    with open(os.path.join(workspace, "external.config"), "w") as f:
+        f.write(f"{name} 1.0\n")
+    recursive = os.path.join(path, "ws-recursive", name)
+    for i in range(nested):
+        nested_path = os.path.join(recursive, *(f"module{j}" for j in range(i)))
+        os.makedirs(nested_path, exist_ok=True)
+        with open(os.path.join(nested_path, "external.config"), "w") as f:
+            f.write(f"{name} 1.0\n")
+    return workspace, recursive
+
+# Counts files & symlinks downloaded to external dirs of workspace
+def count_files(path: str) -> int:
+    total = 0
+    for root, dirs, files in os.walk(path):
+        if "external" in os.path.relpath(root, path).split(os.sep):
+            total += len(files) + len([d for d in dirs if os.path.islink(os.path.join(root, d))])
+    return total
+
+class MockServer():
+    def __init__(self, latency: float, bandwidth: float, page_size: int) -> None:
+        self.process = subprocess.Popen(
+            [sys.executable, os.path.join(BENCH_PATH, "mock_nexus.py"), "--latency", str(latency), "--bandwidth", str(bandwidth), "--page-size", str(page_size)],
+            stdout=subprocess.PIPE,
+            text=True
+        )
+        self.uri = self.process.stdout.readline().strip()
+
+    def call(self, method: str, endpoint: str) -> dict:
+        with urlopen(Request(f"{self.uri}{endpoint}", method=method)) as r:
+            body = r.read()
+        return json.loads(body) if body else {}
+
+    def add_repository(self, name: str) -> None:
+        self.call("PUT", f"/__mock__/repositories/{name}")
+
+    def reset(self) -> None:
+        self.call("POST", "/__mock__/reset")
+
+    def stats(self) -> dict:
+        return self.call("GET", "/__mock__/stats")
+
+    def stop(self) -> None:
+        self.process.terminate()
+        self.process.wait()
+
+# Runs nexmanager, returns exit code, wall time & peak RSS in bytes (None where os.wait4 is not available)
+def run_nexmanager(args: list, env: dict, log_path: str) -> tuple:
+    with open(log_path, "a") as log_file:
+        log_file.write(f"$ nexmanager {' '.join(args)}\n")
+        log_file.flush()
+        started = time.perf_counter()
+        process = subprocess.Popen([sys.executable, MAIN_PATH] + args, env=env, stdin=subprocess.DEVNULL, stdout=log_file, stderr=subprocess.STDOUT)
+        if hasattr(os, "wait4"):
+            _, status, usage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+            rss = usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+        else:
+            process.wait()
+            rss = None
+        return process.returncode, time.perf_counter() - started, rss
+
+def run_scenario(server: MockServer, name: str, args, work_path: str, env: dict) -> list:
+    files = generate_project(os.path.join(work_path, "src"), name, SCENARIOS[name], args.scale, args.seed)
+    workspace, recursive = generate_workspaces(work_path, name, args.workspaces)
+    server.add_repository(name)
+    log_path = os.path.join(work_path, "nexmanager.log")
+    commands = {
+        "upload": ["upload", "-v", "1.0", "-p", os.path.join(work_path, "src", name), "-m", "replace", "-j", str(args.jobs)],
+        "download": ["download", "-e", workspace, "-j", str(args.jobs)],
+        "noop": ["download", "-e", workspace, "-j", str(args.jobs)],
+        "recursive": ["download", "-r", "-e", recursive, "-j", str(args.jobs)]
+    }
+    results = []
+    for step in STEPS:
+        server.reset()
+        code, wall, rss = run_nexmanager(commands[step], env, log_path)
+        stats = server.stats()
+        result = {
+            "scenario": name,
+            "step": step,
+            "ok": code == 0,
+            "wall": round(wall, 3),
+            "requests": stats.get("requests", 0),
+            "bytes_in": stats.get("bytes_in", 0),
+            "bytes_out": stats.get("bytes_out", 0),
+            "rss": rss
+        }
+        result.update({kind: stats.get(kind, 0) for kind in REQUEST_KINDS})
+        if step == "upload":
+            result["files"] = files
+        else:
+            result["files"] = count_files(workspace if step != "recursive" else recursive)
+        if code != 0:
+            print(f"[!] {name}/{step} failed w/ exit code {code}, see {log_path}")
+        results.append(result)
+    return results
+
+def print_report(results: list) -> None:
+    header = ("scenario", "step", "wall s", "files", "requests", "listing", "get", "put", "delete", "sent MiB", "recv MiB", "peak RSS MiB")
+    rows = [header]
+    for r in results:
+        rows.append((
+            r["scenario"],
+            r["step"] + ("" if r["ok"] else " (!)"),
+            f"{r['wall']:.3f}",
+            str(r["files"]),
+            str(r["requests"]),
+            str(r["components"] + r["search"]),
+            str(r["get"]),
+            str(r["put"]),
+            str(r["delete"]),
+            f"{r['bytes_in'] / 1024 ** 2:.1f}",
+            f"{r['bytes_out'] / 1024 ** 2:.1f}",
+            f"{r['rss'] / 1024 ** 2:.1f}" if r["rss"] != None else "n/a"
+        ))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    for row in rows:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+
+# Compares results w/ baseline: any request counter increase or wall time slowdown over tolerance is regression
+def compare(results: list, baseline_path: str, tolerance: float) -> list:
+    with open(baseline_path, "r") as f:
+        baseline = {(r["scenario"], r["step"]): r for r in json.load(f)["results"]}
+    regressions = []
+    for r in results:
+        base = baseline.get((r["scenario"], r["step"]))
+        if base == None:
+            continue
+        for key in ("requests",) + REQUEST_KINDS:
+            if r[key] > base[key]:
+                regressions.append(f"{r['scenario']}/{r['step']}: {key} {base[key]} -> {r[key]}")
+        if r["wall"] > base["wall"] * (1 + tolerance):
+            regressions.append(f"{r['scenario']}/{r['step']}: wall {base['wall']:.3f}s -> {r['wall']:.3f}s")
+        if not r["ok"]:
+            regressions.append(f"{r['scenario']}/{r['step']}: failed")
+    return regressions
+
+def get_arguments():
+    parser = ArgumentParser(description="Benchmarks nexmanager against local Nexus mock.")
+    parser.add_argument("-s", "--scenario", help="Scenario to run, can be repeated, all by default.", type=str, required=False, action="append", choices=list(SCENARIOS), default=[])
+    parser.add_argument("-j", "--jobs", help="nexmanager --jobs value.", type=int, required=False, default=8)
+    parser.add_argument("--scale", help="Multiplier of generated files count, sizes are scaled down only.", type=float, required=False, default=1.0)
+    parser.add_argument("--seed", help="Seed of generated content.", type=int, required=False, default=0)
+    parser.add_argument("--workspaces", help="Nested workspaces count of recursive download.", type=int, required=False, default=4)
+    parser.add_argument("--latency", help="Server latency per request in milliseconds.", type=float, required=False, default=5.0)
+    parser.add_argument("--bandwidth", help="Server bandwidth limit per connection in MiB/s, 0 disables limit.", type=float, required=False, default=0.0)
+    parser.add_argument("--page-size", help="Server components listing page size.", type=int, required=False, default=10)
+    parser.add_argument("-o", "--output", help="Saves results to JSON file, usable as baseline.", type=str, required=False, default="")
+    parser.add_argument("-b", "--baseline", help="JSON results to compare with, exits w/ code 1 on regression.", type=str, required=False, default="")
+    parser.add_argument("-t", "--tolerance", help="Allowed wall time slowdown against baseline.", type=float, required=False, default=0.25)
+    parser.add_argument("-k", "--keep", help="Keeps generated files & nexmanager log.", required=False, action="store_true")
+    return parser.parse_args()
+
+def main() -> None:
+    args = get_arguments()
+    work_path = tempfile.mkdtemp(prefix="nexmanager-bench-")
+    server = MockServer(args.latency, args.bandwidth, args.page_size)
+    env = dict(os.environ, NEXMANAGER_CONFIG_DIR=os.path.join(work_path, "config"))
+    os.makedirs(env["NEXMANAGER_CONFIG_DIR"])
+    with open(os.path.join(env["NEXMANAGER_CONFIG_DIR"], "config.json"), "w") as f:
+        json.dump({"AUTH": "bench:bench", "SERVER_URI": server.uri}, f)
+    results = []
+    try:
+        for name in args.scenario or list(SCENARIOS):
+            results.extend(run_scenario(server, name, args, work_path, env))
+    finally:
+        server.stop()
+        if args.keep:
+            print(f"Generated files & log are kept in {work_path}")
+        else:
+            shutil.rmtree(work_path, ignore_errors=True)
+    print_report(results)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"settings": {key: value for key, value in vars(args).items() if key not in ("output", "baseline", "keep")}, "results": results}, f, indent=4)
+    regressions = compare(results, args.baseline, args.tolerance) if args.baseline else []
+    for regression in regressions:
+        print(f"[!] Regression {regression}")
+    if regressions or not all(r["ok"] for r in results):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Local stand-in for Sonatype Nexus implementing endpoints used by nexmanager:
+# /service/rest/v1/components & /service/rest/v1/search w/ pagination, /service/rest/v1/repositories,
+# /repository/... GET (w/ Range) & PUT, components DELETE
+# Latency & bandwidth limits are injected to every request, components are stored in memory
+# Bench endpoints: GET /__mock__/stats, POST /__mock__/reset, PUT /__mock__/repositories/{name}
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs, unquote
+from argparse import ArgumentParser
+from hashlib import sha1
+import threading
+import base64
+import json
+import time
+import sys
+
+# Size of chunks bodies are throttled by
+THROTTLE_CHUNK = 64 * 1024
+
+class NexusStorage():
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.repositories = {} # {repository: {component_path: (data, sha1)}}
+        self.stats = {}
+
+    def count(self, key: str, value: int = 1) -> None:
+        with self.lock:
+            self.stats[key] = self.stats.get(key, 0) + value
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return dict(self.stats)
+
+    def reset_stats(self) -> dict:
+        with self.lock:
+            stats, self.stats = self.stats, {}
+        return stats
+
+    def add_repository(self, name: str) -> None:
+        with self.lock:
+            self.repositories.setdefault(name, {})
+
+    def put(self, repository: str, path: str, data: bytes) -> bool:
+        with self.lock:
+            if repository not in self.repositories:
+                return False
+            self.repositories[repository][path] = (data, sha1(data).hexdigest())
+            return True
+
+    def get(self, repository: str, path: str) -> bytes | None:
+        with self.lock:
+            item = self.repositories.get(repository, {}).get(path)
+        return item[0] if item else None
+
+    def delete(self, component_id: str) -> bool:
+        repository, path = base64.urlsafe_b64decode(component_id.encode()).decode().split(":", 1)
+        with self.lock:
+            return self.repositories.get(repository, {}).pop(path, None) != None
+
+    # Lists components sorted by path, like Nexus does for raw repositories
+    def list(self, repository: str, prefix: str = "") -> list | None:
+        with self.lock:
+            if repository not in self.repositories:
+                return None
+            items = sorted((path, item[0], item[1]) for path, item in self.repositories[repository].items() if path.startswith(prefix))
+        return [{
+            "id": base64.urlsafe_b64encode(f"{repository}:{path}".encode()).decode(),
+            "repository": repository,
+            "format": "raw",
+            "name": path,
+            "assets": [{"path": path, "fileSize": len(data), "checksum": {"sha1": checksum}}]
+        } for path, data, checksum in items]
+
+class NexusHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    storage = NexusStorage()
+    latency = 0.0
+    bandwidth = 0.0
+    page_size = 10
+
+    def log_message(self, *args) -> None:
+        pass
+
+    # Writes body by chunks keeping rate under bandwidth limit
+    def _write_body(self, body: bytes) -> None:
+        started = time.perf_counter()
+        for offset in range(0, len(body), THROTTLE_CHUNK):
+            self.wfile.write(body[offset:offset + THROTTLE_CHUNK])
+            self._throttle(started, offset + THROTTLE_CHUNK)
+        self.storage.count("bytes_out", len(body))
+
+    def _throttle(self, started: float, transferred: int) -> None:
+        if self.bandwidth > 0:
+            delay = started + transferred / self.bandwidth - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+    def _send(self, code: int, body: bytes = b"", headers: dict = {}) -> None:
+        self.send_response(code)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self._write_body(body)
+
+    def _send_json(self, data) -> None:
+        self._send(200, json.dumps(data).encode(), {"Content-Type": "application/json"})
+
+    # Reads request body, chunked bodies of streamed uploads included
+    def _read_body(self) -> bytes:
+        started = time.perf_counter()
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            body = bytearray()
+            while True:
+                size = int(self.rfile.readline().split(b";")[0].strip(), 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                body += self.rfile.read(size)
+                self.rfile.readline()
+                self._throttle(started, len(body))
+            body = bytes(body)
+        else:
+            body = bytearray()
+            length = int(self.headers.get("Content-Length", 0))
+            while len(body) < length:
+                chunk = self.rfile.read(min(THROTTLE_CHUNK, length - len(body)))
+                if not chunk:
+                    break
+                body += chunk
+                self._throttle(started, len(body))
+            body = bytes(body)
+        self.storage.count("bytes_in", len(body))
+        return body
+
+    def _begin(self, kind: str) -> None:
+        if kind != "mock":
+            self.storage.count(kind)
+            self.storage.count("requests")
+            if self.latency > 0:
+                time.sleep(self.latency)
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        path = unquote(url.path)
+        query = parse_qs(url.query)
+        if path == "/__mock__/stats":
+            self._begin("mock")
+            return self._send_json(self.storage.reset_stats() if "reset" in query else self.storage.snapshot())
+        if path in ("/", ""):
+            self._begin("root")
+            return self._send(200, b"Nexus mock")
+        if path == "/service/rest/v1/repositories":
+            self._begin("repositories")
+            return self._send_json([{"name": name, "format": "raw", "type": "hosted"} for name in sorted(self.storage.repositories)])
+        if path in ("/service/rest/v1/components", "/service/rest/v1/search"):
+            self._begin(path.split("/")[-1])
+            prefix = query.get("name", [""])[0].rstrip("*") if path.endswith("search") else ""
+            items = self.storage.list(query.get("repository", [""])[0], prefix)
+            if items == None:
+                return self._send(404, b"Repository not found")
+            start = int(query.get("continuationToken", ["0"])[0])
+            token = str(start + self.page_size) if start + self.page_size < len(items) else None
+            return self._send_json({"items": items[start:start + self.page_size], "continuationToken": token})
+        if path.startswith("/repository/") and path.count("/") >= 3:
+            self._begin("get")
+            _, _, repository, component = path.split("/", 3)
+            data = self.storage.get(repository, component)
+            if data == None:
+                return self._send(404, b"Not found")
+            if self.headers.get("Range", "").startswith("bytes="):
+                offset = int(self.headers["Range"][6:].split("-")[0])
+                if offset >= len(data):
+                    return self._send(416, b"", {"Content-Range": f"bytes */{len(data)}"})
+                return self._send(206, data[offset:], {"Content-Range": f"bytes {offset}-{len(data) - 1}/{len(data)}"})
+            return self._send(200, data)
+        self._begin("unknown")
+        self._send(404, b"Not found")
+
+    def do_PUT(self) -> None:
+        path = unquote(urlparse(self.path).path)
+        if path.startswith("/__mock__/repositories/"):
+            self._begin("mock")
+            self.storage.add_repository(path.split("/")[-1])
+            return self._send(201)
+        self._begin("put")
+        body = self._read_body()
+        if not path.startswith("/repository/") or path.count("/") < 3:
+            return self._send(400, b"Bad request")
+        _, _, repository, component = path.split("/", 3)
+        self._send(201 if self.storage.put(repository, component, body) else 404)
+
+    def do_POST(self) -> None:
+        if urlparse(self.path).path == "/__mock__/reset":
+            self._begin("mock")
+            self.storage.reset_stats()
+            return self._send(204)
+        self._begin("unknown")
+        self._send(404, b"Not found")
+
+    def do_DELETE(self) -> None:
+        path = unquote(urlparse(self.path).path)
+        self._begin("delete")
+        if not path.startswith("/service/rest/v1/components/"):
+            return self._send(404, b"Not found")
+        self._send(204 if self.storage.delete(path.split("/")[-1]) else 404)
+
+# Starts server in background thread, returns server & its uri
+def serve(port: int = 0, latency: float = 0.0, bandwidth: float = 0.0, page_size: int = 10, repositories: list = []) -> tuple:
+    NexusHandler.latency = latency
+    NexusHandler.bandwidth = bandwidth
+    NexusHandler.page_size = page_size
+    for name in repositories:
+        NexusHandler.storage.add_repository(name)
+    server = ThreadingHTTPServer(("127.0.0.1", port), NexusHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def main() -> None:
+    parser = ArgumentParser(description="Local mock of Sonatype Nexus raw repositories API.")
+    parser.add_argument("--port", help="Port to listen, random free port by default.", type=int, required=False, default=0)
+    parser.add_argument("--latency", help="Latency added to every request in milliseconds.", type=float, required=False, default=0.0)
+    parser.add_argument("--bandwidth", help="Bandwidth limit of every connection in MiB/s, 0 disables limit.", type=float, required=False, default=0.0)
+    parser.add_argument("--page-size", help="Components listing page size.", type=int, required=False, default=10)
+    parser.add_argument("-r", "--repository", help="Repository to create, can be repeated.", type=str, required=False, action="append", default=[])
+    args = parser.parse_args()
+    server, uri = serve(args.port, args.latency / 1000, args.bandwidth * 1024 * 1024, args.page_size, args.repository)
+    print(uri, flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+        sys.exit(0)
+
+if __name__ == "__main__":
+    main()
@@ -1,92 +1,900 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+# Heavy modules (requests, concurrent.futures, tarfile, zstandard) are imported where they are used, so CLI starts fast
+from __future__ import annotations
 from argparse import ArgumentParser
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
+from fnmatch import fnmatch
 from hashlib import sha1
-import requests
+from typing import TYPE_CHECKING
+import stat
+import atexit
+import threading
+import shutil
 import json
 import enum
+import time
+import sys
 import os
 
-CURRENT_PATH = os.getcwd().replace("\\", "/")
+# Imported at runtime where they are used, here only for annotations
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+    import requests
 
-if os.name == "nt":
-    CONFIG_PATH = '/'.join((os.environ["ProgramData"].replace("\\", "/"), "nexus-manager"))
-elif os.name == "posix":
-    CONFIG_PATH = f"/Users/{os.getlogin()}/Library/Preferences"
-else:
-    CONFIG_PATH = "/etc/nexus-manager"
+# Env var overriding config dir
+CONFIG_PATH_ENV = "NEXMANAGER_CONFIG_DIR"
 
+# Config defaults, values from config.json are merged by load_config
 CONFIG_DATA = {
     "AUTH": "",
-    "SERVER_URI": "http://localhost:8081"
+    "SERVER_URI": "http://localhost:8081",
+    # HTTP session settings
+    "POOL_SIZE": 10,
+    "RETRIES": 3,
+    "BACKOFF_FACTOR": 0.5,
+    "CONNECT_TIMEOUT": 10,
+    "READ_TIMEOUT": 60,
+    # Downloads settings
+    "CHUNK_SIZE": 1024 * 1024,
+    "LISTING_CACHE_TTL": 0,
+    # Shared artifacts cache settings, empty CACHE_DIR disables cache
+    "CACHE_DIR": "",
+    "CACHE_SIZE_LIMIT": 10 * 1024 ** 3,
+    "CACHE_LINK": "auto"
 }
 
-if not os.path.exists(CONFIG_PATH):
-    os.mkdir(CONFIG_PATH)
+# Set once config.json is merged to CONFIG_DATA
+CONFIG_LOADED = False
 
-if not os.path.isfile(f"{CONFIG_PATH}/config.json"):
-    with open(f"{CONFIG_PATH}/config.json", "w") as f:
-        json.dump(CONFIG_DATA, f)
-else:
-    with open(f"{CONFIG_PATH}/config.json", "r") as f:
-        CONFIG_DATA = json.load(f)
+# Resolves per-user config dir: $NEXMANAGER_CONFIG_DIR if set, else
+# %APPDATA%/nexus-manager on Windows, ~/Library/Preferences/nexus-manager on macOS, $XDG_CONFIG_HOME/nexus-manager elsewhere
+def get_config_path() -> str:
+    if os.environ.get(CONFIG_PATH_ENV):
+        return os.environ[CONFIG_PATH_ENV].replace("\\", "/").rstrip("/")
+    if os.name == "nt":
+        base = os.environ.get("APPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Roaming")
+    elif sys.platform == "darwin":
+        base = os.path.join(os.path.expanduser("~"), "Library", "Preferences")
+    else:
+        base = os.environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config")
+    return "/".join((base.replace("\\", "/"), "nexus-manager"))
+
+# Config files written by previous versions, read only if there is no config in config dir yet
+# Previous versions used %ProgramData%/nexus-manager on Windows & /Users/{login}/Library/Preferences on every posix system
+def get_legacy_config_files() -> list:
+    if os.name == "nt":
+        return ["/".join((os.environ["ProgramData"].replace("\\", "/"), "nexus-manager", "config.json"))] if os.environ.get("ProgramData") else []
+    if os.name != "posix":
+        return ["/etc/nexus-manager/config.json"]
+    import getpass
+    try:
+        login = getpass.getuser()
+    except (KeyError, OSError):
+        return []
+    return [f"/Users/{login}/Library/Preferences/config.json"]
+
+# Merges config.json to CONFIG_DATA on first call, nothing is created until config is updated
+# Library users should call it before overriding CONFIG_DATA values
+def load_config() -> None:
+    global CONFIG_LOADED
+    if CONFIG_LOADED:
+        return
+    CONFIG_LOADED = True
+    for config_file in [f"{get_config_path()}/config.json"] + get_legacy_config_files():
+        if not os.path.isfile(config_file):
+            continue
+        try:
+            with open(config_file, "r") as f:
+                CONFIG_DATA.update(json.load(f))
+        except (OSError, ValueError):
+            print(f"Warning, broken config file {config_file}; Defaults are used")
+        return
+
+# Log levels: errors are shown even w/ --quiet, per-file lines only w/ --verbose
+ERROR = 0
+INFO = 1
+VERBOSE = 2
+
+# Thread-safe buffered logger: lines are written to stdout in batches at most every FLUSH_INTERVAL seconds,
+# errors & explicit flush() write them out immediately
+# Aggregate progress line is redrawn in place on stderr if it's terminal & level is INFO
+class Logger():
+    FLUSH_INTERVAL = 0.2
+    FLUSH_LINES = 1000
+    REDRAW_INTERVAL = 0.1
+
+    def __init__(self, level: int = INFO) -> None:
+        self.level = level
+        self.lock = threading.RLock()
+        self.buffer = []
+        self.flushed = time.monotonic()
+        self.progress = None
+        self.progress_shown = False
+        self.drawn = 0.0
+        self.paused = False
+
+    def log(self, level: int, args: tuple) -> None:
+        if level > self.level:
+            return
+        line = f"[{datetime.now().strftime('%H:%M:%S.%f')[:-3]}] " + " ".join(str(arg) for arg in args)
+        with self.lock:
+            self.buffer.append(line)
+            if level == ERROR or len(self.buffer) >= self.FLUSH_LINES or time.monotonic() - self.flushed >= self.FLUSH_INTERVAL:
+                self._flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self.paused:
+            return
+        self.flushed = time.monotonic()
+        if len(self.buffer) == 0:
+            return
+        self._clear_progress()
+        sys.stdout.write("\n".join(self.buffer) + "\n")
+        sys.stdout.flush()
+        self.buffer.clear()
+        self._draw_progress()
+
+    # Starts showing progress, it's drawn only to terminal
+    def start_progress(self, progress) -> None:
+        with self.lock:
+            self.progress = progress if self.level == INFO and sys.stderr.isatty() else None
+
+    # Redraws progress line & writes out stale buffered lines, not more often than every REDRAW_INTERVAL seconds
+    def update_progress(self) -> None:
+        now = time.monotonic()
+        if now - self.drawn < self.REDRAW_INTERVAL:
+            return
+        with self.lock:
+            if self.paused:
+                return
+            self.drawn = now
+            if len(self.buffer) != 0 and now - self.flushed >= self.FLUSH_INTERVAL:
+                self._flush()
+            else:
+                self._draw_progress()
+
+    # Keeps terminal for user prompt: progress line is cleared, log lines stay buffered until resume_output
+    def pause_output(self) -> None:
+        with self.lock:
+            self._flush()
+            self._clear_progress()
+            self.paused = True
+
+    def resume_output(self) -> None:
+        with self.lock:
+            self.paused = False
+            self._flush()
+            self._draw_progress()
+
+    def finish_progress(self) -> None:
+        with self.lock:
+            self._flush()
+            self._clear_progress()
+            self.progress = None
+
+    def _draw_progress(self) -> None:
+        if self.progress == None or self.paused:
+            return
+        self.drawn = time.monotonic()
+        sys.stderr.write(f"\r{self.progress.render()}\033[K")
+        sys.stderr.flush()
+        self.progress_shown = True
+
+    def _clear_progress(self) -> None:
+        if self.progress_shown:
+            sys.stderr.write("\r\033[K")
+            sys.stderr.flush()
+            self.progress_shown = False
+
+LOGGER = Logger()
+atexit.register(LOGGER.finish_progress)
+
+def log(*args, level: int = INFO) -> None:
+    LOGGER.log(level, args)
+
+# Formats seconds to short duration string: 1h02m, 3m04s, 5s
+def format_duration(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
+
+# Aggregate progress of concurrent transfers: processed files of total, transferred bytes, throughput & ETA
+# Counters are updated from workers, e.g. by futures done callbacks
+class Progress():
+    def __init__(self, action: str) -> None:
+        self.action = action
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+        self.total = 0
+        self.done = 0
+        self.bytes = 0
+
+    def add_total(self, count: int = 1) -> None:
+        with self.lock:
+            self.total += count
+
+    def add_bytes(self, size: int) -> None:
+        with self.lock:
+            self.bytes += size
+        LOGGER.update_progress()
+
+    # Marks file as processed, usable as future done callback
+    def file_done(self, future=None) -> None:
+        with self.lock:
+            self.done += 1
+        LOGGER.update_progress()
+
+    def render(self) -> str:
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        line = f"{self.action}: {self.done}/{self.total} files, {format_size(self.bytes)}, {format_size(self.bytes / elapsed)}/s"
+        if 0 < self.done < self.total:
+            line += f", ETA {format_duration(elapsed / self.done * (self.total - self.done))}"
+        return line
+
+    # Logs final progress summary
+    def summary(self) -> None:
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        log(f"{self.action}: {self.done} file(s) processed, {format_size(self.bytes)} transferred in {elapsed:.1f}s ({format_size(self.bytes / elapsed)}/s)")
+
+# Computes sha1 of file reading it by chunks
+def file_sha1(path: str, chunk_size: int = 1024 * 1024) -> str:
+    checksum = sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            checksum.update(chunk)
+    return checksum.hexdigest()
+
+# File object wrapper which computes sha1 & size of data read through it
+class HashingReader():
+    def __init__(self, fileobj) -> None:
+        self.fileobj = fileobj
+        self.checksum = sha1()
+        self.size = 0
 
-def log(*args) -> None:
-    print(f"[{datetime.now().strftime('%H:%M:%S.%f')[:-3]}]", end=" ")
-    for arg in args:
-        print(arg, end=" ")
-    print(end="\n")
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.fileobj.read(size)
+        self.checksum.update(chunk)
+        self.size += len(chunk)
+        return chunk
+
+    def tell(self) -> int:
+        return self.fileobj.tell()
+
+    # Rewinding to start restarts checksum, so body resent by HTTP retry is hashed once
+    def seek(self, offset: int, whence: int = 0) -> int:
+        position = self.fileobj.seek(offset, whence)
+        if position == 0:
+            self.checksum = sha1()
+            self.size = 0
+        return position
+
+    # Reads rest of data, so checksum covers whole stream
+    def drain(self) -> None:
+        while self.read(CONFIG_DATA["CHUNK_SIZE"]):
+            pass
+
+    def close(self) -> None:
+        self.fileobj.close()
+
+# Write-only sink which computes sha1 & size of data written to it & discards data
+class HashingWriter():
+    def __init__(self) -> None:
+        self.checksum = sha1()
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self.checksum.update(data)
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+# Imports optional zstandard package, None if it's not installed
+def import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+# Gets bundle compression by archive name, None if name is not bundle archive
+def bundle_compression(name: str) -> str | None:
+    for compression, extension in BUNDLE_FORMATS.items():
+        if name.endswith(extension):
+            return compression
+    return None
+
+# Gets build params of bundle by archive name: {platform}-{architecture}-{target}.tar.gz -> {platform}-{architecture}-{target}
+def bundle_target(name: str) -> str:
+    return name[:-len(BUNDLE_FORMATS[bundle_compression(name)])]
+
+# Packs dir to streamed tar archive w/ given compression, macOS .DS_Store files are excluded
+# Archive is reproducible: entries are sorted (by tarfile), their mtime & owner are normalized & gzip header has no timestamp,
+# so same dir content is always packed to archive w/ same checksum
+def write_bundle(fileobj, path: str, compression: str) -> None:
+    def normalize(info):
+        if info.name.split("/")[-1] == ".DS_Store":
+            return None
+        info.mtime = 0
+        info.uid, info.gid = 0, 0
+        info.uname, info.gname = "", ""
+        return info
+    import tarfile
+    if compression == "zst":
+        with import_zstandard().ZstdCompressor().stream_writer(fileobj, closefd=False) as zst:
+            with tarfile.open(fileobj=zst, mode="w|") as tar:
+                tar.add(path, arcname=os.path.basename(path), filter=normalize)
+        return
+    if compression == "gz":
+        import gzip
+        with gzip.GzipFile(filename="", mode="wb", fileobj=fileobj, mtime=0) as gz:
+            with tarfile.open(fileobj=gz, mode="w|") as tar:
+                tar.add(path, arcname=os.path.basename(path), filter=normalize)
+        return
+    with tarfile.open(fileobj=fileobj, mode="w|") as tar:
+        tar.add(path, arcname=os.path.basename(path), filter=normalize)
+
+# Extracts streamed tar archive w/ given compression to path
+# Absolute links & links out of path are rejected
+def extract_bundle(fileobj, path: str, compression: str) -> None:
+    import tarfile
+    if compression == "zst":
+        fileobj = import_zstandard().ZstdDecompressor().stream_reader(fileobj, closefd=False)
+    with tarfile.open(fileobj=fileobj, mode="r|gz" if compression == "gz" else "r|") as tar:
+        tar.extractall(path, filter="data")
+
+# Formats size in bytes to human readable string
+def format_size(size: float) -> str:
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{int(size)} {unit}"
+        size /= 1024
+    return f"{size:.1f} TiB"
 
 def update_config(key: str, value: str) -> None:
+    load_config()
     CONFIG_DATA[key] = value
-    with open(f"{CONFIG_PATH}/config.json", "w") as f:
+    config_path = get_config_path()
+    os.makedirs(config_path, exist_ok=True)
+    with open(f"{config_path}/config.json.tmp", "w") as f:
         json.dump(CONFIG_DATA, f)
+    os.replace(f"{config_path}/config.json.tmp", f"{config_path}/config.json")
 
 def print_config() -> None:
+    print(f"Config file: {get_config_path()}/config.json")
     print(f"Auth: {CONFIG_DATA['AUTH']}\nServer URI: {CONFIG_DATA['SERVER_URI']}")
+    print(f"Pool size: {CONFIG_DATA['POOL_SIZE']}\nRetries: {CONFIG_DATA['RETRIES']} (backoff factor {CONFIG_DATA['BACKOFF_FACTOR']})")
+    print(f"Timeouts: connect {CONFIG_DATA['CONNECT_TIMEOUT']}s, read {CONFIG_DATA['READ_TIMEOUT']}s")
+    print(f"Download chunk size: {CONFIG_DATA['CHUNK_SIZE']}\nListing cache TTL: {CONFIG_DATA['LISTING_CACHE_TTL']}s")
+    print(f"Artifacts cache: {CONFIG_DATA['CACHE_DIR'] or 'disabled'} (limit {format_size(CONFIG_DATA['CACHE_SIZE_LIMIT'])}, {CONFIG_DATA['CACHE_LINK']})")
 
 def input_loop(print_str: str, available_options: tuple[str]) -> str:
-    while True:
-        user_choice = input(f"{print_str}Enter q to exit\n")
-        if user_choice in available_options:
-            break
-        elif user_choice == "q":
-            exit(0)
+    LOGGER.pause_output()
+    try:
+        while True:
+            user_choice = input(f"{print_str}Enter q to exit\n")
+            if user_choice in available_options:
+                break
+            elif user_choice == "q":
+                exit(0)
+    finally:
+        LOGGER.resume_output()
     return user_choice
 
+# Attempts to remove component before it's reported as failed
+DELETE_ATTEMPTS = 3
+
+# Server statuses requests are retried on
+RETRY_STATUSES = (500, 502, 503, 504)
+
+# Dirs skipped while searching for external.config files
+PRUNED_DIRS = ("external", ".git", ".svn", ".hg")
+
+# Bundle archive extensions by compression
+BUNDLE_FORMATS = {"tar": ".tar", "gz": ".tar.gz", "zst": ".tar.zst"}
+
+# Linux ioctl request cloning file extents (copy-on-write reflink on btrfs, xfs, ...)
+FICLONE = 0x40049409
+
+# Ways of placing cached artifacts to workspaces
+CACHE_LINK_MODES = ("auto", "hardlink", "copy")
+
 class MergeOptions(enum.Enum):
     # Main merge options
     manual    = 0
     replace   = 1
     overwrite = 2
     append    = 3
+    sync      = 4
     # Auxiliary options to handle merge
     y = 0
     N = 0
     o = 2
     a = 3
 
+# Endpoint kinds requests are aggregated by
+def endpoint_kind(method: str, endpoint: str) -> str:
+    if endpoint.startswith("/service/rest/v1/"):
+        kind = endpoint.split("?")[0].split("/")[4]
+        return "listing" if kind in ("components", "search") and method == "GET" else kind
+    if endpoint.startswith("/repository/"):
+        return "download" if method == "GET" else "upload"
+    return "server"
+
+# Gets value at given quantile of sorted values
+def quantile(values: list, q: float) -> float:
+    return values[int(q * (len(values) - 1))] if len(values) != 0 else 0.0
+
+# Run instrumentation: HTTP requests (latency, bytes, status, retries) & phases spans of run
+# Created only w/ --stats, --trace or --prometheus, so disabled instrumentation costs single None check per request
+# Bytes are taken from Content-Length headers, streamed bodies w/o it are not counted
+class RunStats():
+    def __init__(self, command: str) -> None:
+        self.command = command
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.started_perf = time.perf_counter()
+        self.duration = None
+        self.requests = [] # [{"time", "method", "kind", "endpoint", "status", "latency", "sent", "received", "retries"}, ...]
+        self.spans = [] # [{"phase", "time", "duration", "thread"}, ...]
+        self.counters = {}
+
+    # Statuses in expected are answers request is made for (e.g. 404 of optional file) & are not counted as errors
+    def record_request(self, method: str, endpoint: str, started: float, status: int | None, sent: int, received: int, retries: int, expected: tuple = ()) -> None:
+        now = time.perf_counter()
+        request = {
+            "time": round(started - self.started_perf, 6),
+            "method": method,
+            "kind": endpoint_kind(method, endpoint),
+            "endpoint": endpoint,
+            "status": status,
+            "error": status == None or (status >= 400 and status not in expected),
+            "latency": round(now - started, 6),
+            "sent": sent,
+            "received": received,
+            "retries": retries
+        }
+        with self.lock:
+            self.requests.append(request)
+
+    # Measures phase span, phases of concurrent workers overlap
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            span = {
+                "phase": name,
+                "time": round(started - self.started_perf, 6),
+                "duration": round(time.perf_counter() - started, 6),
+                "thread": threading.current_thread().name
+            }
+            with self.lock:
+                self.spans.append(span)
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def finish(self) -> None:
+        self.duration = time.perf_counter() - self.started_perf
+
+    # Aggregates requests by kind & spans by phase
+    def summary(self) -> dict:
+        kinds = {}
+        for request in self.requests:
+            kind = kinds.setdefault(request["kind"], {"requests": 0, "errors": 0, "retries": 0, "sent": 0, "received": 0, "latencies": []})
+            kind["requests"] += 1
+            kind["errors"] += request["error"]
+            kind["retries"] += request["retries"]
+            kind["sent"] += request["sent"]
+            kind["received"] += request["received"]
+            kind["latencies"].append(request["latency"])
+        for kind in kinds.values():
+            latencies = sorted(kind.pop("latencies"))
+            kind["latency"] = {"sum": round(sum(latencies), 6), "p50": quantile(latencies, 0.5), "p95": quantile(latencies, 0.95), "max": latencies[-1]}
+        phases = {}
+        for span in self.spans:
+            phase = phases.setdefault(span["phase"], {"count": 0, "duration": 0.0})
+            phase["count"] += 1
+            phase["duration"] = round(phase["duration"] + span["duration"], 6)
+        return {
+            "command": self.command,
+            "started": self.started,
+            "duration": round(self.duration if self.duration != None else time.perf_counter() - self.started_perf, 6),
+            "requests": {
+                "total": len(self.requests),
+                "errors": sum(kind["errors"] for kind in kinds.values()),
+                "retries": sum(kind["retries"] for kind in kinds.values()),
+                "sent": sum(kind["sent"] for kind in kinds.values()),
+                "received": sum(kind["received"] for kind in kinds.values()),
+                "kinds": kinds
+            },
+            "phases": phases,
+            "counters": dict(self.counters)
+        }
+
+    def print_summary(self) -> None:
+        summary = self.summary()
+        requests = summary["requests"]
+        print(f"Run stats ({self.command}, {summary['duration']:.3f}s):")
+        print(f"  Requests: {requests['total']} ({requests['errors']} failed, {requests['retries']} retries), sent {format_size(requests['sent'])}, received {format_size(requests['received'])}")
+        for name, kind in sorted(requests["kinds"].items()):
+            latency = kind["latency"]
+            print(f"    {name:<14}{kind['requests']:>7}  p50 {latency['p50'] * 1000:.1f}ms  p95 {latency['p95'] * 1000:.1f}ms  max {latency['max'] * 1000:.1f}ms")
+        if len(summary["phases"]) != 0:
+            print("  Phases (summed over workers):")
+            for name, phase in sorted(summary["phases"].items(), key=lambda item: -item[1]["duration"]):
+                print(f"    {name:<14}{phase['duration']:>9.3f}s  ({phase['count']})")
+        if len(summary["counters"]) != 0:
+            print("  Components: " + ", ".join(f"{name} {value}" for name, value in sorted(summary["counters"].items())))
+
+    # Writes summary w/ every request & phase span as JSON
+    def write_trace(self, path: str) -> None:
+        trace = self.summary()
+        trace["trace"] = {"requests": self.requests, "spans": self.spans}
+        with open(path, "w") as f:
+            json.dump(trace, f, indent=4)
+
+    # Writes metrics in Prometheus text format, temp file is renamed so node_exporter textfile collector never reads partial file
+    def write_prometheus(self, path: str) -> None:
+        summary = self.summary()
+        labels = f'command="{self.command}"'
+        lines = []
+        def metric(name: str, kind: str, help: str, samples: list) -> None:
+            lines.append(f"# HELP nexmanager_{name} {help}")
+            lines.append(f"# TYPE nexmanager_{name} {kind}")
+            for suffix, extra, value in samples:
+                lines.append(f"nexmanager_{name}{suffix}{{{labels}{extra}}} {value}")
+        metric("run_timestamp_seconds", "gauge", "Start time of last run.", [("", "", summary["started"])])
+        metric("run_duration_seconds", "gauge", "Duration of last run.", [("", "", summary["duration"])])
+        kinds = summary["requests"]["kinds"]
+        metric("requests", "gauge", "HTTP requests of last run by endpoint kind.", [("", f',kind="{name}"', kind["requests"]) for name, kind in sorted(kinds.items())])
+        metric("request_errors", "gauge", "Failed HTTP requests of last run by endpoint kind.", [("", f',kind="{name}"', kind["errors"]) for name, kind in sorted(kinds.items())])
+        metric("request_retries", "gauge", "HTTP retries of last run by endpoint kind.", [("", f',kind="{name}"', kind["retries"]) for name, kind in sorted(kinds.items())])
+        samples = []
+        for name, kind in sorted(kinds.items()):
+            samples.extend([
+                ("", f',kind="{name}",quantile="0.5"', kind["latency"]["p50"]),
+                ("", f',kind="{name}",quantile="0.95"', kind["latency"]["p95"]),
+                ("_sum", f',kind="{name}"', kind["latency"]["sum"]),
+                ("_count", f',kind="{name}"', kind["requests"])
+            ])
+        metric("request_duration_seconds", "summary", "HTTP requests latency of last run by endpoint kind.", samples)
+        metric("transferred_bytes", "gauge", "Bytes transferred by last run.", [
+            ("", ',direction="sent"', summary["requests"]["sent"]),
+            ("", ',direction="received"', summary["requests"]["received"])
+        ])
+        metric("phase_duration_seconds", "gauge", "Duration of last run phases summed over workers.", [("", f',phase="{name}"', phase["duration"]) for name, phase in sorted(summary["phases"].items())])
+        metric("components", "gauge", "Components of last run by result.", [("", f',result="{name}"', value) for name, value in sorted(summary["counters"].items())])
+        with open(f"{path}.tmp", "w") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(f"{path}.tmp", path)
+
+# Raised when any page of repository listing fails, so partial listing is never used as complete one
+class ListingError(Exception):
+    pass
+
+class NexusClient():
+    def __init__(self, user: str, password: str, pool_size: int = 0) -> None:
+        import requests
+        load_config()
+        self.server_uri = CONFIG_DATA["SERVER_URI"]
+        self.timeout = (CONFIG_DATA["CONNECT_TIMEOUT"], CONFIG_DATA["READ_TIMEOUT"])
+        self.session = requests.Session()
+        self.session.auth = (user, password)
+        # Session w/o retries for one-shot bodies (generators), which can't be resent by urllib3
+        self.single_session = requests.Session()
+        self.single_session.auth = (user, password)
+        self.pool_size = 0
+        self.resize_pool(max(pool_size, CONFIG_DATA["POOL_SIZE"]))
+        self.stats = None
+
+    # Mounts adapter w/ connection pool of pool_size connections if current one is smaller
+    # Retries connection errors & 5xx responses w/ exponential backoff
+    def resize_pool(self, pool_size: int) -> None:
+        if pool_size <= self.pool_size:
+            return
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        self.pool_size = pool_size
+        retries = Retry(
+            total=CONFIG_DATA["RETRIES"],
+            backoff_factor=CONFIG_DATA["BACKOFF_FACTOR"],
+            status_forcelist=RETRY_STATUSES,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        single_adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=Retry(total=0, raise_on_status=False))
+        self.single_session.mount("http://", single_adapter)
+        self.single_session.mount("https://", single_adapter)
+
+    # Sends request to server endpoint w/ default timeouts
+    # Records request to stats if instrumentation is enabled
+    # retry=False sends request once, caller has to retry it w/ fresh body
+    # expected statuses are not counted as failed requests by instrumentation
+    def request(self, method: str, endpoint: str, retry: bool = True, expected: tuple = (), **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        session = self.session if retry else self.single_session
+        if self.stats == None:
+            return session.request(method, f"{self.server_uri}{endpoint}", **kwargs)
+        started = time.perf_counter()
+        try:
+            r = session.request(method, f"{self.server_uri}{endpoint}", **kwargs)
+        except Exception:
+            self.stats.record_request(method, endpoint, started, None, 0, 0, 0)
+            raise
+        retries = getattr(r.raw, "retries", None)
+        self.stats.record_request(
+            method,
+            endpoint,
+            started,
+            r.status_code,
+            int(r.request.headers.get("Content-Length", 0)),
+            int(r.headers.get("Content-Length", 0)),
+            len(retries.history) if retries != None else 0,
+            expected
+        )
+        return r
+
+    # Measures phase span if instrumentation is enabled
+    def phase(self, name: str):
+        return self.stats.phase(name) if self.stats != None else nullcontext()
+
+    def count(self, name: str, value: int = 1) -> None:
+        if self.stats != None:
+            self.stats.count(name, value)
+
+    def get(self, endpoint: str, **kwargs) -> requests.Response:
+        return self.request("GET", endpoint, **kwargs)
+
+    def put(self, endpoint: str, **kwargs) -> requests.Response:
+        return self.request("PUT", endpoint, **kwargs)
+
+    def delete(self, endpoint: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", endpoint, **kwargs)
+
+    # Checks if server is up
+    def check_server(self) -> None:
+        try:
+            r = self.get("")
+            if not r.ok:
+                log(f"Server {self.server_uri} check failed", level=ERROR)
+                exit(1)
+        except:
+            log(f"Server {self.server_uri} check failed", level=ERROR)
+            exit(1)
+
+    # Lists repository components lazily, page by page, following continuationToken
+    # if prefix provided -> filters components by name on server side via search API
+    # Raises ListingError if any page request fails
+    def iter_components(self, repository: str, prefix: str = ""):
+        endpoint = "search" if prefix else "components"
+        params = {"repository": repository}
+        if prefix:
+            params["name"] = f"{prefix}*"
+        while True:
+            r = self.get(f"/service/rest/v1/{endpoint}", params=params)
+            if not r.ok:
+                raise ListingError(f"Listing of {repository} repository failed: Status code {r.status_code}")
+            page = r.json()
+            for item in page["items"]:
+                if item["name"].startswith(prefix):
+                    yield item
+            if not page.get("continuationToken"):
+                return
+            params["continuationToken"] = page["continuationToken"]
+
+# Content-addressed store of downloaded files shared between workspaces: {CACHE_DIR}/{sha1[:2]}/{sha1}
+# Objects access time is touched on every hit & used for LRU eviction, mtime is left intact so hardlinked files stay valid in manifests
+class ArtifactCache():
+    def __init__(self, path: str, size_limit: int, link_mode: str = "auto") -> None:
+        self.path = path.replace("\\", "/").rstrip("/")
+        self.size_limit = size_limit
+        self.link_mode = link_mode
+
+    # Creates cache from config, None if CACHE_DIR is not set
+    @classmethod
+    def from_config(cls):
+        load_config()
+        if not CONFIG_DATA["CACHE_DIR"]:
+            return None
+        return cls(CONFIG_DATA["CACHE_DIR"], CONFIG_DATA["CACHE_SIZE_LIMIT"], CONFIG_DATA["CACHE_LINK"])
+
+    def _object_path(self, checksum: str) -> str:
+        return f"{self.path}/{checksum[:2]}/{checksum}"
+
+    def _touch(self, object_path: str) -> None:
+        try:
+            os.utime(object_path, ns=(time.time_ns(), os.stat(object_path).st_mtime_ns))
+        except OSError:
+            pass
+
+    # Places cached object to filepath, returns False on cache miss
+    # Object is rehashed if verify is set or its size & mtime differ from ones recorded at store
+    # (e.g. hardlinked workspace copy was edited in place), corrupted objects are evicted
+    def fetch(self, checksum: str, filepath: str, verify: bool = False) -> bool:
+        object_path = self._object_path(checksum)
+        try:
+            st = os.stat(object_path)
+        except OSError:
+            return False
+        if verify or self._read_meta(object_path) != (st.st_size, st.st_mtime_ns):
+            if file_sha1(object_path) != checksum:
+                log(f"[!] Cached object {checksum} is corrupted; Evicting it", level=ERROR)
+                self._evict(object_path)
+                return False
+            self._write_meta(object_path, st)
+        tmp_path = f"{filepath}.cache"
+        try:
+            self._link(object_path, tmp_path)
+            os.replace(tmp_path, filepath)
+        except OSError as e:
+            log(f"[!] Failed to fetch {checksum} from cache: {e}", level=ERROR)
+            self._remove(tmp_path)
+            return False
+        self._touch(object_path)
+        return True
+
+    # Adds downloaded file to cache, temp file is renamed so concurrent runs never see partial objects
+    def store(self, filepath: str, checksum: str) -> None:
+        object_path = self._object_path(checksum)
+        if os.path.isfile(object_path):
+            self._touch(object_path)
+            return
+        tmp_path = f"{object_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            self._link(filepath, tmp_path)
+            os.replace(tmp_path, object_path)
+            self._write_meta(object_path, os.stat(object_path))
+        except OSError as e:
+            log(f"[!] Failed to add {filepath} to cache: {e}", level=ERROR)
+            self._remove(tmp_path)
+
+    # Size & mtime of object recorded in {object}.meta, None if it's missing or unreadable
+    @staticmethod
+    def _read_meta(object_path: str) -> tuple | None:
+        try:
+            with open(f"{object_path}.meta", "r") as f:
+                size, mtime = f.read().split()
+            return int(size), int(mtime)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, object_path: str, st: os.stat_result) -> None:
+        tmp_path = f"{object_path}.meta.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                f.write(f"{st.st_size} {st.st_mtime_ns}")
+            os.replace(tmp_path, f"{object_path}.meta")
+        except OSError:
+            self._remove(tmp_path)
+
+    def _evict(self, object_path: str) -> None:
+        self._remove(object_path)
+        self._remove(f"{object_path}.meta")
+
+    # Hardlinks or clones file, falls back to plain copy when link is not possible (e.g. different filesystems)
+    def _link(self, src: str, dst: str) -> None:
+        if os.path.lexists(dst):
+            os.remove(dst)
+        if self.link_mode == "hardlink":
+            try:
+                os.link(src, dst)
+                return
+            except OSError:
+                pass
+        elif self.link_mode == "auto" and self._reflink(src, dst):
+            return
+        shutil.copyfile(src, dst)
+
+    # Clones file w/ copy-on-write reflink (Linux FICLONE ioctl), returns False if filesystem doesn't support it
+    @staticmethod
+    def _reflink(src: str, dst: str) -> bool:
+        try:
+            import fcntl
+        except ImportError:
+            return False
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            try:
+                fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+                return True
+            except OSError:
+                return False
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    # Lists cached objects as (path, size, access time)
+    def _objects(self) -> list:
+        objects = []
+        if not os.path.isdir(self.path):
+            return objects
+        for bucket in os.scandir(self.path):
+            if not bucket.is_dir(follow_symlinks=False):
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.name.endswith((".tmp", ".meta")) or not entry.is_file(follow_symlinks=False):
+                    continue
+                st = entry.stat(follow_symlinks=False)
+                objects.append((entry.path, st.st_size, st.st_atime_ns))
+        return objects
+
+    # Returns objects count & total size
+    def stats(self) -> tuple[int, int]:
+        objects = self._objects()
+        return len(objects), sum(size for _, size, _ in objects)
+
+    # Evicts least recently used objects until cache fits size limit
+    # Returns evicted objects count & freed size
+    def prune(self, size_limit: int | None = None) -> tuple[int, int]:
+        size_limit = self.size_limit if size_limit == None else size_limit
+        objects = sorted(self._objects(), key=lambda o: o[2])
+        total = sum(size for _, size, _ in objects)
+        evicted, freed = 0, 0
+        for path, size, _ in objects:
+            if total <= size_limit:
+                break
+            self._evict(path)
+            total -= size
+            evicted += 1
+            freed += size
+        return evicted, freed
+
 class NexusRawDownload():
-    def __init__(self, user: str, password: str, filter_options: tuple, config_path: str = CURRENT_PATH, force_download: bool = False) -> None:
+    def __init__(self, user: str, password: str, filter_options: tuple, config_path: str = "", force_download: bool = False, jobs: int = 1, client: NexusClient | None = None, verify: bool = False, fsync: bool = True, ignore: list | None = None, stats: RunStats | None = None) -> None:
+        if not config_path: config_path = os.getcwd().replace("\\", "/")
         if config_path.endswith("/"): config_path = config_path[:-1]
-        self.auth = (user, password)
+        self.client = client if client else NexusClient(user, password)
+        self.client.resize_pool(jobs)
+        if stats != None: self.client.stats = stats
         self.config_path = config_path
         self.force_download = force_download
+        self.verify = verify
+        self.fsync = fsync
+        self.ignore = list(ignore) if ignore != None else []
         self.filter = filter_options
-        self.tasks = self._parse_config()
-        self._check_server()
+        self.jobs = jobs
+        self.errors = []
+        self.manifests = {}
+        self.listings = {}
+        self.persisted = set()
+        self.metadata = {}
+        self.path_locks = {}
+        self.path_locks_lock = threading.Lock()
+        self.progress = Progress("Download")
+        self.cache = ArtifactCache.from_config()
+        self.tasks = self._parse_config(config_path)
+        self.client.check_server()
 
-    # Parses config file at initialisation
-    def _parse_config(self, recursive: bool = False) -> list:
+    # Parses config file of given dir
+    def _parse_config(self, config_path: str, recursive: bool = False) -> list:
         tasks = []
-        if not os.path.isfile(f"{self.config_path}/external.config"):
+        if not os.path.isfile(f"{config_path}/external.config"):
             if recursive:
                 raise FileNotFoundError
             else:
-                log("external.config file not found in provided directory")
+                log("external.config file not found in provided directory", level=ERROR)
                 exit(1)
-        with open(f"{self.config_path}/external.config", "r") as f:
+        with open(f"{config_path}/external.config", "r") as f:
             for line in f.readlines():
                 line = line.strip().split("#")[0]
                 if len(line) == 0:
@@ -95,65 +903,369 @@ class NexusRawDownload():
                 tasks.append((line[0], line[1]))
         return tasks
     
-    # Checks if server is up
-    def _check_server(self) -> None:
-        try:
-            r = requests.get(CONFIG_DATA['SERVER_URI'], auth=self.auth)
-            if not r.ok:
-                log(f"Server {CONFIG_DATA['SERVER_URI']} check failed")
-                exit(1)
-        except:
-            log(f"Server {CONFIG_DATA['SERVER_URI']} check failed")
-            exit(1)
-    
-    # Parses all dirs recursively
-    def _parse_dirs(self, path: str, all_paths: list[str]) -> None:
-        for p in os.scandir(path):
-            if p.is_dir():
-                all_paths.append(p.path)
-                self._parse_dirs(p, all_paths)
-
-    # Parses all dirs, then self.start for dirs w/ correct config file
-    def start_recursive(self) -> None:
-        current_paths = [self.config_path]
-        self._parse_dirs(self.config_path, current_paths)
-        for path in current_paths:
+    # Walks dirs iteratively in sorted order & yields dirs containing external.config
+    # Download dirs, VCS dirs & dirs matching ignore globs are pruned, symlinks to dirs are not followed
+    def _find_config_dirs(self, root: str):
+        stack = [root]
+        while len(stack) != 0:
+            path = stack.pop()
             try:
-                self.config_path = path
-                self.tasks = self._parse_config(recursive=True)
-            except FileNotFoundError:
-                log(f"Not found/Wrong config file in {path}")
+                with self.client.phase("discovery"), os.scandir(path) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError:
                 continue
-            self.start()
+            subdirs = []
+            for entry in entries:
+                if entry.name == "external.config" and entry.is_file():
+                    yield path
+                elif entry.is_dir(follow_symlinks=False) and not self._is_ignored(root, entry):
+                    subdirs.append(entry.path)
+            stack.extend(reversed(subdirs))
+
+    # Checks if dir should be pruned while searching for config files
+    def _is_ignored(self, root: str, entry: os.DirEntry) -> bool:
+        if entry.name in PRUNED_DIRS:
+            return True
+        relpath = entry.path[len(root):].lstrip("/")
+        for pattern in self.ignore:
+            if fnmatch(entry.name, pattern) or fnmatch(relpath, pattern):
+                return True
+        return False
 
-    # Downloads projects one by one
+    # Yields dirs w/ their tasks as soon as config files are found
+    def _iter_configs(self, root: str):
+        for path in self._find_config_dirs(root):
+            try:
+                yield path, self._parse_config(path, recursive=True)
+            except FileNotFoundError:
+                log(f"Not found/Wrong config file in {path}", level=ERROR)
+
+    # Searches dirs w/ config files & downloads their tasks while search is still running
+    def start_recursive(self) -> None:
+        self._download_configs(self._iter_configs(self.config_path))
+        self._report_errors()
+        LOGGER.flush()
+
+    # Downloads projects from external.config
     def start(self) -> None:
-        for task in self.tasks:
-            self._start_task(task[0], task[1])
+        self._download_configs([(self.config_path, self.tasks)])
+        self._report_errors()
+        LOGGER.flush()
 
-    # Download project function
-    def _start_task(self, project_name: str, version: str) -> None:
-        rep_components = self._get_rep(project_name)
-        flag = False
-        log(f"Downloading {project_name}-{version}...")
+    # Downloads projects of (config_path, tasks) pairs w/ pool of self.jobs workers
+    # Pairs are consumed lazily, same project versions are listed once & their results are merged
+    # Results are logged in plan order, symlinks are created after all components are written
+    # {(project_name, version): [(filepath1, future1), ...]}
+    def _download_configs(self, configs) -> None:
+        plan = {}
+        symlinks = []
+        config_tasks = {}
+        # {(config_path, project_name, version): [(filepath1, future1), ...]}
+        started = {}
+        from concurrent.futures import ThreadPoolExecutor
+        LOGGER.start_progress(self.progress)
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            for config_path, tasks in configs:
+                config_tasks[config_path] = tasks
+                for (project_name, version), downloads in self._submit_config(config_path, tasks, pool, symlinks).items():
+                    started[(config_path, project_name, version)] = downloads
+            self._retry_stale(started, config_tasks, pool, symlinks)
+            for (_, project_name, version), downloads in started.items():
+                plan.setdefault((project_name, version), []).extend(downloads)
+            for (project_name, version), downloads in plan.items():
+                self._finish_task(project_name, version, downloads)
+        with self.client.phase("manifests"):
+            for config_path in self.manifests:
+                self._save_manifest(config_path)
+            self._save_listings()
+        with self.client.phase("symlinks"):
+            self._create_symlinks(symlinks)
+        if self.cache != None:
+            with self.client.phase("cache"):
+                self.cache.prune()
+        LOGGER.finish_progress()
+        if self.progress.total != 0:
+            self.progress.summary()
+
+    # Plans tasks of config dir & submits their components, only tasks in given set are submitted if it's set
+    # {(project_name, version): [(filepath1, future1), ...]}
+    def _submit_config(self, config_path: str, tasks: list, pool: ThreadPoolExecutor, symlinks: list, only: set | None = None) -> dict:
+        planned = []
+        # Repeated task keeps its last position, like w/ sequential downloads
+        for project_name, version in reversed(dict.fromkeys(reversed(tasks))):
+            try:
+                planned.append((project_name, version, self._start_task(project_name, version, config_path, symlinks)))
+            except ListingError as e:
+                if only == None or (project_name, version) in only:
+                    log(f"[!] {e}; {project_name}-{version} skipped", level=ERROR)
+                    self.errors.append((f"{config_path}: {project_name}-{version}", str(e)))
+        submitted = {}
+        for project_name, version, items in self._drop_overwritten(planned):
+            if only != None and (project_name, version) not in only:
+                continue
+            downloads = [(filepath, pool.submit(self._run_locked, filepath, handler, *args)) for filepath, _, handler, args in items]
+            self.progress.add_total(len(downloads))
+            for _, future in downloads:
+                future.add_done_callback(self.progress.file_done)
+            submitted[(project_name, version)] = downloads
+        return submitted
+
+    # Project versions listed from persisted listings are listed again & downloaded once more
+    # if any of their components is missing on server or has other checksum, i.e. version was re-uploaded
+    def _retry_stale(self, started: dict, config_tasks: dict, pool: ThreadPoolExecutor, symlinks: list) -> None:
+        stale = {}
+        for (config_path, project_name, version), downloads in started.items():
+            if (project_name, f"{project_name}-{version}/") in self.persisted and any(self._is_stale_error(future) for _, future in downloads):
+                stale.setdefault(config_path, set()).add((project_name, version))
+        for config_path, tasks in stale.items():
+            for project_name, version in tasks:
+                prefix = f"{project_name}-{version}/"
+                if (project_name, prefix) in self.persisted:
+                    log(f"Cached listing of {project_name}-{version} is outdated; Listing it again")
+                    self.persisted.discard((project_name, prefix))
+                    del self.listings[project_name][prefix]
+                    self.metadata.pop((project_name, version), None)
+            for (project_name, version), downloads in self._submit_config(config_path, config_tasks[config_path], pool, symlinks, tasks).items():
+                started[(config_path, project_name, version)] = downloads
+
+    # Checks if download failed as component listed from outdated listing
+    @staticmethod
+    def _is_stale_error(future) -> bool:
+        try:
+            error = future.result()
+        except Exception:
+            return False
+        return error != None and (error == "Status code 404" or error.startswith("Checksum mismatch"))
+
+    # Loads manifest of downloaded files stored next to external dir
+    # {external_path: {"size": ..., "mtime_ns": ..., "ino": ..., "sha1": ...}}
+    def _load_manifest(self, config_path: str) -> None:
+        self.manifests[config_path] = {}
+        if os.path.isfile(f"{config_path}/.external.manifest"):
+            try:
+                with open(f"{config_path}/.external.manifest", "r") as f:
+                    self.manifests[config_path] = json.load(f)
+            except (OSError, ValueError):
+                log(f"[!] Broken {config_path}/.external.manifest file; Files will be rehashed", level=ERROR)
+
+    # Saves manifest, temp file is renamed so manifest is never half-written
+    def _save_manifest(self, config_path: str) -> None:
+        if not os.path.isdir(f"{config_path}/external"):
+            return
+        with open(f"{config_path}/.external.manifest.tmp", "w") as f:
+            json.dump(self.manifests[config_path], f)
+        os.replace(f"{config_path}/.external.manifest.tmp", f"{config_path}/.external.manifest")
+
+    # Saves file stat & checksum to manifest
+    def _update_manifest(self, config_path: str, filepath: str, checksum: str) -> None:
+        file_stat = os.stat(filepath)
+        self.manifests[config_path][self._manifest_key(config_path, filepath)] = {
+            "size": file_stat.st_size,
+            "mtime_ns": file_stat.st_mtime_ns,
+            "ino": file_stat.st_ino,
+            "sha1": checksum
+        }
+
+    # Generates manifest key: path relative to external dir
+    @staticmethod
+    def _manifest_key(config_path: str, filepath: str) -> str:
+        return filepath[len(f"{config_path}/external/"):]
+
+    # Checks if local file matches checksum
+    # File is trusted w/o rehashing if its stat matches manifest, unless self.verify
+    def _is_up_to_date(self, config_path: str, filepath: str, checksum: str) -> bool:
+        try:
+            file_stat = os.stat(filepath)
+        except OSError:
+            return False
+        if not stat.S_ISREG(file_stat.st_mode):
+            return False
+        entry = self.manifests[config_path].get(self._manifest_key(config_path, filepath))
+        if not self.verify and entry != None and entry["sha1"] == checksum and \
+                entry["size"] == file_stat.st_size and \
+                entry["mtime_ns"] == file_stat.st_mtime_ns and \
+                entry["ino"] == file_stat.st_ino:
+            return True
+        with self.client.phase("hashing"):
+            if file_sha1(filepath) != checksum:
+                return False
+        self._update_manifest(config_path, filepath, checksum)
+        return True
+
+    # Download project function: plans project components for given dir, they are submitted once whole config is planned
+    # Listing & metadata are fetched once per project version
+    # [(filepath1, build_params_dir1, handler1, args1), ...], filepath of bundle is its build params dir
+    def _start_task(self, project_name: str, version: str, config_path: str, symlinks: list) -> list:
+        with self.client.phase("listing"):
+            rep_components = self._get_cached_rep(project_name, version)
+            if (project_name, version) not in self.metadata:
+                self.metadata[(project_name, version)] = []
+                for comp in rep_components:
+                    if comp[0].split("/")[-1] == ".metadata":
+                        self.metadata[(project_name, version)] = self._get_metadata(project_name, comp[0], comp[1])
+        if config_path not in self.manifests:
+            self._load_manifest(config_path)
+        symlinks.extend(self._parse_metadata(self.metadata[(project_name, version)], project_name, config_path))
+        downloads = []
+        # Build params dirs w/ bundle are extracted from it only, their per-file components would race w/ bundle extraction
+        bundles = {}
         for comp in rep_components:
-            if comp[0].startswith(f"{project_name}-{version}") and comp[0].split("/")[-1] == ".metadata":
-                self._handle_metadata(project_name, comp[0])
-            elif comp[0].startswith(f"{project_name}-{version}") and self._filter(comp[0].split("/")[2].split("-")):
-                self._handle_component(project_name, comp[0], comp[1], self.force_download)
-                flag = True
-        if flag:
-            log(f"Successfully downloaded {project_name}-{version}")
-        else:
+            comp_parts = comp[0].split("/")
+            if len(comp_parts) == 3 and comp_parts[1] == ".bundles" and bundle_compression(comp_parts[2]) != None:
+                bundles.setdefault(bundle_target(comp_parts[2]), comp[0])
+        for comp in rep_components:
+            comp_parts = comp[0].split("/")
+            if len(comp_parts) == 3 and comp_parts[1] == ".bundles" and bundle_compression(comp_parts[2]) != None:
+                if bundles[bundle_target(comp_parts[2])] != comp[0]:
+                    log(f"[!] {project_name}-{version} has several bundles of {bundle_target(comp_parts[2])}; {comp_parts[2]} skipped", level=ERROR)
+                    continue
+                if self._filter(bundle_target(comp_parts[2]).split("-")):
+                    target_dir = f"{config_path}/external/{project_name}/{bundle_target(comp_parts[2])}"
+                    downloads.append((target_dir, target_dir, self._handle_bundle, (project_name, comp[0], config_path, target_dir, comp[1], self.force_download)))
+            # Other {project_name}-{version}/.* files are version service files
+            elif len(comp_parts) > 2 and comp_parts[1] == project_name and comp_parts[2] not in bundles and self._filter(comp_parts[2].split("-")):
+                filepath = self._generate_filepath(comp[0], config_path)
+                build_dir = f"{config_path}/external/{project_name}/{comp_parts[2]}"
+                downloads.append((filepath, build_dir, self._handle_component, (project_name, comp[0], config_path, filepath, comp[1], self.force_download)))
+        return downloads
+
+    # Runs component handler holding lock of its path, so its temp files are never shared by 2 workers
+    def _run_locked(self, filepath: str, handler, *args) -> str | None:
+        with self.path_locks_lock:
+            lock = self.path_locks.setdefault(filepath, threading.Lock())
+        with lock:
+            return handler(*args)
+
+    # Drops components of config tasks overwritten by later tasks, e.g. same file of 2 project versions,
+    # so last listed version wins like w/ sequential downloads & no path is written by 2 workers
+    # Bundle dir is never mixed w/ files of other version: later bundle drops earlier files of its dir & vice versa
+    # [(project_name1, version1, components1), ...]
+    @staticmethod
+    def _drop_overwritten(planned: list) -> list:
+        files, file_dirs, bundle_dirs = set(), set(), set()
+        result = []
+        for project_name, version, items in reversed(planned):
+            kept = []
+            for item in items:
+                filepath, build_dir = item[0], item[1]
+                if build_dir in bundle_dirs or filepath in files or (filepath == build_dir and build_dir in file_dirs):
+                    log(f"{filepath} of {project_name}-{version} is overwritten by later version; Skipped", level=VERBOSE)
+                    continue
+                kept.append(item)
+            for filepath, build_dir, _, _ in kept:
+                if filepath == build_dir:
+                    bundle_dirs.add(build_dir)
+                else:
+                    files.add(filepath)
+                    file_dirs.add(build_dir)
+            result.append((project_name, version, kept))
+        result.reverse()
+        return result
+
+    # Waits for project components & logs results
+    def _finish_task(self, project_name: str, version: str, downloads: list) -> None:
+        log(f"Downloading {project_name}-{version}...")
+        failed = 0
+        for filepath, future in downloads:
+            try:
+                error = future.result()
+            except Exception as e:
+                error = str(e)
+            if error == "":
+                log("Downloaded component to", filepath, level=VERBOSE)
+                self.client.count("downloaded")
+            elif error != None:
+                self.errors.append((filepath, error))
+                self.client.count("failed")
+                failed += 1
+            else:
+                self.client.count("skipped")
+        if len(downloads) == 0:
             log(f"Nothing to download for {project_name}-{version}")
+        elif failed != 0:
+            log(f"[!] Downloaded {project_name}-{version} with {failed} failed component(s)", level=ERROR)
+        else:
+            log(f"Successfully downloaded {project_name}-{version}")
 
+    # Logs summary of failed downloads
+    def _report_errors(self) -> None:
+        if len(self.errors) == 0:
+            return
+        log(f"[!] {len(self.errors)} component(s) failed to download:", level=ERROR)
+        for filepath, error in self.errors:
+            log(f"    {filepath}: {error}", level=ERROR)
             
-    # Get repository components
-    def _get_rep(self, rep_name: str) -> list:
-        r = requests.get(f"{CONFIG_DATA['SERVER_URI']}/service/rest/v1/components?repository={rep_name}", auth=self.auth)
-        if r.ok:
-            return [(item["name"], item["assets"][0]["checksum"]["sha1"]) for item in r.json()["items"]]
-        return []
+    # Get repository components, lazily
+    # [(component_path1, sha1), ...]
+    def _get_rep(self, rep_name: str, prefix: str = ""):
+        for item in self.client.iter_components(rep_name, prefix):
+            if len(item["assets"]) != 0:
+                yield (item["name"], item["assets"][0]["checksum"]["sha1"])
+
+    # Get version files from manifest published w/ version, single request instead of listing
+    # Returns None if version has no manifest
+    # [(component_path1, sha1), ...]
+    def _get_manifest_rep(self, rep_name: str, version: str) -> list | None:
+        # Versions uploaded before manifests were published have none, so 404 is expected answer
+        r = self.client.get(f"/repository/{rep_name}/{rep_name}-{version}/.manifest", expected=(404,))
+        if not r.ok:
+            return None
+        try:
+            manifest = r.json()
+        except ValueError:
+            log(f"[!] Broken {rep_name}-{version} manifest; Falling back to repository listing", level=ERROR)
+            return None
+        result = [(item["path"], item["sha1"]) for item in manifest["files"]]
+        if manifest["metadata"] != None:
+            result.append((f"{rep_name}-{version}/.metadata", manifest["metadata"]))
+        return result
+
+    # Get version components from run-scoped cache, fetched once per repository & version
+    # Version manifest is used if it's published, else repository listing
+    # Listings are persisted between runs if LISTING_CACHE_TTL is set
+    def _get_cached_rep(self, rep_name: str, version: str) -> list:
+        prefix = f"{rep_name}-{version}/"
+        if rep_name not in self.listings:
+            self.listings[rep_name] = self._load_listings(rep_name)
+            self.persisted.update((rep_name, listing_prefix) for listing_prefix in self.listings[rep_name])
+        if prefix not in self.listings[rep_name]:
+            items = self._get_manifest_rep(rep_name, version)
+            if items == None:
+                items = list(self._get_rep(rep_name, prefix))
+            self.listings[rep_name][prefix] = {"time": time.time(), "items": items}
+        return self.listings[rep_name][prefix]["items"]
+
+    # Persisted listings dir of configured server, listings of other servers are kept in their own dirs
+    @staticmethod
+    def _listings_dir() -> str:
+        return f"{get_config_path()}/listings/{sha1(CONFIG_DATA['SERVER_URI'].rstrip('/').encode()).hexdigest()[:16]}"
+
+    # Loads persisted repository listings which are not older than LISTING_CACHE_TTL seconds
+    # {prefix: {"time": timestamp, "items": [(component_path1, sha1), ...]}}
+    @classmethod
+    def _load_listings(cls, rep_name: str) -> dict:
+        listings_path = f"{cls._listings_dir()}/{rep_name}.json"
+        if CONFIG_DATA["LISTING_CACHE_TTL"] <= 0 or not os.path.isfile(listings_path):
+            return {}
+        try:
+            with open(listings_path, "r") as f:
+                listings = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        now = time.time()
+        return {prefix: listing for prefix, listing in listings.items() if now - listing["time"] < CONFIG_DATA["LISTING_CACHE_TTL"]}
+
+    # Persists non-empty repository listings if LISTING_CACHE_TTL is set
+    def _save_listings(self) -> None:
+        if CONFIG_DATA["LISTING_CACHE_TTL"] <= 0:
+            return
+        listings_dir = self._listings_dir()
+        os.makedirs(listings_dir, exist_ok=True)
+        for rep_name, listings in self.listings.items():
+            listings = {prefix: listing for prefix, listing in listings.items() if len(listing["items"]) != 0}
+            with open(f"{listings_dir}/{rep_name}.json.tmp", "w") as f:
+                json.dump(listings, f)
+            os.replace(f"{listings_dir}/{rep_name}.json.tmp", f"{listings_dir}/{rep_name}.json")
     
     # Filter components by platform/architecture/target
     def _filter(self, filter: list) -> bool:
@@ -163,61 +1275,121 @@ class NexusRawDownload():
         return True
 
     # Generate path to given component
-    def _generate_filepath(self, component: str) -> str:
-        return '/'.join((self.config_path, "external", '/'.join(component.split('/')[1:])))
-
-    # Handle component: generate downloaded file path -> make dirs -> download
-    def _handle_component(self, project_name: str, component: str, checksum: str, force_download: bool = False) -> None:
-        filepath = self._generate_filepath(component)
-        filedir = f"{self.config_path}/external/{'/'.join(component.split('/')[1:-1])}"
-        if not os.path.exists(filedir):
-            os.makedirs(filedir)
-        if force_download or not os.path.isfile(filepath) or (os.path.isfile(filepath) and sha1(open(filepath,'rb').read()).hexdigest() != checksum):
-            self._send_download_request(filepath, f"{project_name}/{component}")
+    @staticmethod
+    def _generate_filepath(component: str, config_path: str) -> str:
+        return '/'.join((config_path, "external", '/'.join(component.split('/')[1:])))
+
+    # Handle component: make dirs -> download if missing or changed
+    # Returns None if file is up to date, "" if downloaded, else error message
+    def _handle_component(self, project_name: str, component: str, config_path: str, filepath: str, checksum: str, force_download: bool = False) -> str | None:
+        filedir = os.path.dirname(filepath)
+        os.makedirs(filedir, exist_ok=True)
+        if not force_download and self._is_up_to_date(config_path, filepath, checksum):
+            return None
+        if self.cache != None and checksum:
+            with self.client.phase("cache"):
+                if self.cache.fetch(checksum, filepath, self.verify):
+                    self._update_manifest(config_path, filepath, checksum)
+                    return ""
+        with self.client.phase("transfer"):
+            error = self._send_download_request(filepath, f"{project_name}/{component}", checksum)
+        if error == "":
+            self._update_manifest(config_path, filepath, checksum)
+            if self.cache != None and checksum:
+                with self.client.phase("cache"):
+                    self.cache.store(filepath, checksum)
+        return error
     
-    # Handle metadata file:
-    def _handle_metadata(self, project_name: str, component: str):
-        filepath = self._generate_filepath(component)
-        self._send_download_request(filepath, f"{project_name}/{component}", False)
-        with open(filepath, "r") as metadata:
-            metadata = metadata.readlines()
-            self._parse_metadata(metadata, project_name)
-        os.remove(filepath)
-
-    # Parses metadata and creates symlinks
-    def _parse_metadata(self, data: list, project_name: str) -> None:
+    # Handle bundle: downloads & extracts archive if its checksum differs from manifest or target dir is missing
+    # Returns None if bundle is up to date, "" if downloaded, else error message
+    def _handle_bundle(self, project_name: str, component: str, config_path: str, target_dir: str, checksum: str, force_download: bool = False) -> str | None:
+        manifest_key = f"{project_name}/.bundles/{component.split('/')[-1]}"
+        entry = self.manifests[config_path].get(manifest_key)
+        if not force_download and not self.verify and entry != None and entry["sha1"] == checksum and os.path.isdir(target_dir):
+            return None
+        with self.client.phase("transfer"):
+            error = self._send_bundle_request(target_dir, f"{project_name}/{component}", bundle_compression(component), checksum)
+        if error == "":
+            self.manifests[config_path][manifest_key] = {"sha1": checksum}
+        return error
+
+    # Downloads bundle & extracts it while streaming to temp dir,
+    # which replaces target dir after archive checksum is verified
+    # Returns "" if downloaded, else error message
+    def _send_bundle_request(self, target_dir: str, endpoint: str, compression: str, checksum: str) -> str:
+        tmp_dir = f"{os.path.dirname(target_dir)}/.{os.path.basename(target_dir)}.part"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+        try:
+            with self.client.get(f"/repository/{endpoint}", stream=True) as r:
+                if not r.ok:
+                    return f"Status code {r.status_code}"
+                r.raw.decode_content = True
+                reader = HashingReader(r.raw)
+                extract_bundle(reader, tmp_dir, compression)
+                reader.drain()
+                self.progress.add_bytes(reader.size)
+            if reader.checksum.hexdigest() != checksum:
+                return f"Checksum mismatch: expected {checksum}, got {reader.checksum.hexdigest()}"
+            if os.path.lexists(target_dir):
+                os.rename(target_dir, f"{tmp_dir}/.old")
+            os.rename(f"{tmp_dir}/{os.path.basename(target_dir)}", target_dir)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return ""
+
+    # Handle metadata file: downloads -> returns its lines
+    def _get_metadata(self, project_name: str, component: str, checksum: str) -> list:
+        r = self.client.get(f"/repository/{project_name}/{component}")
+        if not r.ok or sha1(r.content).hexdigest() != checksum:
+            log(f"[!] Metadata download failed for {component}; Symlinks skipped", level=ERROR)
+            return []
+        return r.text.splitlines()
+
+    # Parses metadata
+    # [(symlink_path1, symlink_target1), ...]
+    def _parse_metadata(self, data: list, project_name: str, config_path: str) -> list:
+        symlinks = []
         current_parent = 0
         for line in data:
             line = line.strip().split()
+            if len(line) == 0:
+                continue
             if line[0] == "symlinks:":
                 current_parent = 1
             else:
                 if current_parent == 1:
                     if self._filter(line[0].split("/")[0].split("-")):
-                        symlink_path = f"{self.config_path}/external/{project_name}/{line[0]}"
-                        symlink_path_to = self._get_target_path(line[0], line[1], project_name)
+                        symlink_path = f"{config_path}/external/{project_name}/{line[0]}"
+                        symlink_path_to = self._get_target_path(line[0], line[1], project_name, config_path)
                         if symlink_path_to == None:
-                            log(f"[!] Symlink {line[0]} target out of range; Skipped")
+                            log(f"[!] Symlink {line[0]} target out of range; Skipped", level=ERROR)
                             continue
-                        try:
-                            os.symlink(symlink_path_to, symlink_path)
-                            log(f"Saved symlink to {symlink_path}")
-                        except FileExistsError:
-                            pass
-                        except OSError:
-                            log(f"Possibly no permissions to create symlinks: {symlink_path}")
-                        except Exception as e:
-                            log(f"Something went wrong while creating symlink {symlink_path}")
-                            print(e)
+                        symlinks.append((symlink_path, symlink_path_to))
+        return symlinks
+
+    # Creates symlinks
+    def _create_symlinks(self, symlinks: list) -> None:
+        for symlink_path, symlink_path_to in symlinks:
+            try:
+                os.symlink(symlink_path_to, symlink_path)
+                log(f"Saved symlink to {symlink_path}", level=VERBOSE)
+            except FileExistsError:
+                pass
+            except OSError:
+                log(f"Possibly no permissions to create symlinks: {symlink_path}", level=ERROR)
+            except Exception as e:
+                log(f"Something went wrong while creating symlink {symlink_path}:", e, level=ERROR)
 
     # Gets target path
     # if absolute -> checks if link to file/dir inside {project_name} dir
     # if relative -> checks if steps back count < available steps back for symlink path
-    def _get_target_path(self, symlink_path: str, target: str, project_name: str) -> str | None:
+    @staticmethod
+    def _get_target_path(symlink_path: str, target: str, project_name: str, config_path: str) -> str | None:
         if os.path.isabs(target):
             if len(target.split(project_name)) == 1:
                 return None
-            return f"{self.config_path}/external/{project_name}/{target.split(project_name)[1]}"
+            return f"{config_path}/external/{project_name}/{target.split(project_name)[1]}"
         steps_count = len(symlink_path.split("/")) - 1
         steps_back_count = 0
         for part in target.split("/"):
@@ -228,28 +1400,60 @@ class NexusRawDownload():
         return target
 
     # Downloads component from rep to given path
-    def _send_download_request(self, download_to_path: str, endpoint: str, not_silent: bool = True) -> None:
-        r = requests.get(f"{CONFIG_DATA['SERVER_URI']}/repository/{endpoint}", stream=True, auth=self.auth)
-        if r.ok:
-            if not_silent: log("Downloading component to", download_to_path)
-            with open(download_to_path, "wb") as f:
-                for chunk in r.iter_content(chunk_size=1024 * 8):
-                    if chunk:
-                        f.write(chunk)
-                        f.flush()
-                        os.fsync(f.fileno())
-            return
-        if not_silent: log(f"Download failed: Status code {r.status_code}\n{download_to_path}\n{r.text}")
+    # Content is written to temp file & hashed while streaming,
+    # then temp file is synced once & atomically renamed to given path
+    # Interrupted download leaves temp file, which is resumed w/ Range request if checksum is known
+    # Returns "" if downloaded, else error message
+    def _send_download_request(self, download_to_path: str, endpoint: str, checksum: str | None = None, resume: bool = True) -> str:
+        tmp_path = f"{download_to_path}.part"
+        offset = 0
+        if resume and checksum != None and os.path.isfile(tmp_path):
+            offset = os.path.getsize(tmp_path)
+        headers = {"Range": f"bytes={offset}-"} if offset != 0 else {}
+        with self.client.get(f"/repository/{endpoint}", stream=True, headers=headers) as r:
+            if r.status_code == 416 or (r.status_code == 206 and not r.headers.get("Content-Range", "").startswith(f"bytes {offset}-")):
+                return self._send_download_request(download_to_path, endpoint, checksum, False)
+            if not r.ok:
+                return f"Status code {r.status_code}"
+            file_checksum = sha1()
+            resumed = r.status_code == 206
+            if resumed:
+                with open(tmp_path, "rb") as f:
+                    for chunk in iter(lambda: f.read(CONFIG_DATA["CHUNK_SIZE"]), b""):
+                        file_checksum.update(chunk)
+            with open(tmp_path, "ab" if resumed else "wb") as f:
+                for chunk in r.iter_content(chunk_size=CONFIG_DATA["CHUNK_SIZE"]):
+                    f.write(chunk)
+                    file_checksum.update(chunk)
+                    self.progress.add_bytes(len(chunk))
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+        if checksum != None and file_checksum.hexdigest() != checksum:
+            os.remove(tmp_path)
+            if resumed:
+                return self._send_download_request(download_to_path, endpoint, checksum, False)
+            return f"Checksum mismatch: expected {checksum}, got {file_checksum.hexdigest()}"
+        os.replace(tmp_path, download_to_path)
+        return ""
 
 class NexusRawUpload():
-    def __init__(self, path: str, version: str, user: str, password: str, merge: str = "manual") -> None:
+    def __init__(self, path: str, version: str, user: str, password: str, merge: str = "manual", jobs: int = 1, client: NexusClient | None = None, prune: bool = False, bundle: str | None = None, stats: RunStats | None = None) -> None:
         if path.endswith("/"): path = path[:-1]
-        self.auth = (user, password)
+        self.client = client if client else NexusClient(user, password)
+        self.client.resize_pool(jobs)
+        if stats != None: self.client.stats = stats
         self.path = path
         self.project_name = path.split("/")[-1]
         self.version = version
         self.merge = self._prepare_merge(merge)
-        self.check_server()
+        self.prune = prune
+        self.bundle = bundle
+        self.jobs = jobs
+        self.components = {}
+        self.errors = []
+        self.progress = Progress("Upload")
+        self.client.check_server()
         self._check_repository()
 
     # Prepares merge variable
@@ -261,36 +1465,31 @@ class NexusRawUpload():
                 return MergeOptions.replace
         return MergeOptions[merge]
     
-    # Checks if server is up
-    def check_server(self) -> None:
-        try:
-            r = requests.get(CONFIG_DATA['SERVER_URI'], auth=self.auth)
-            if not r.ok:
-                log(f"Server {CONFIG_DATA['SERVER_URI']} check failed")
-                exit(1)
-        except:
-            log(f"Server {CONFIG_DATA['SERVER_URI']} check failed")
-            exit(1)
-    
     # Checks if repository with provided name exists
     def _check_repository(self) -> None:
-        reps = requests.get(f"{CONFIG_DATA['SERVER_URI']}/service/rest/v1/repositories", auth=self.auth).json()
+        reps = self.client.get("/service/rest/v1/repositories").json()
         for rep in reps:
             if rep["name"] == self.project_name:
                 return
-        log(f"Repository {self.project_name} not found")
+        log(f"Repository {self.project_name} not found", level=ERROR)
         exit(1)
     
+    # Builds index of current version components, fetched once per upload
+    # {component_path: {"id": component_id, "sha1": checksum, "size": size}}
+    def _build_components_index(self) -> dict:
+        index = {}
+        for item in self.client.iter_components(self.project_name, f"{self.project_name}-{self.version}/"):
+            asset = item["assets"][0] if len(item["assets"]) != 0 else {}
+            index[item["name"]] = {
+                "id": item["id"],
+                "sha1": asset["checksum"]["sha1"] if asset else None,
+                "size": asset.get("fileSize")
+            }
+        return index
+
     # Get repository components to be removed
     def _get_delete_rep(self) -> list:
-        r = requests.get(f"{CONFIG_DATA['SERVER_URI']}/service/rest/v1/components?repository={self.project_name}", auth=self.auth)
-        if r.ok:
-            result = []
-            for item in r.json()["items"]:
-                if item["name"].startswith(f"{self.project_name}-{self.version}"):
-                    result.append((item["id"], item["name"]))
-            return result
-        return []
+        return [(comp["id"], comp_path) for comp_path, comp in self.components.items()]
     
     # Get all components
     # [(os_filepath1, nexus_path1), ...]
@@ -303,21 +1502,138 @@ class NexusRawUpload():
                 result.append((filepath, filepath.replace(self.path, "")[1:]))
         return result
     
-    # Handle component: uploads if not symlink, else adds component index to list
-    def _handle_component(self, component: tuple, symlinks: list, comp_index: int) -> None:
+    # Handle component: submits upload to pool if not symlink, else adds component index to list
+    # Merge questions are asked here, in main thread
+    def _handle_component(self, component: tuple, symlinks: list, comp_index: int, pool: ThreadPoolExecutor, uploads: list, checksum: str | None = None) -> None:
         if not os.path.islink(component[0]):
-            comp_id = self._get_component_id(component[1])
-            if self._handle_merge(comp_id, component[1]):
-                self._send_upload_request(component[0], component[1])
+            comp = self._get_component(component[1])
+            if self._handle_merge(comp, component[1], checksum):
+                uploads.append((component[1], self._component_path(component[1]), self._submit_upload(pool, self._upload_component, component[0], component[1])))
         else:
             symlinks.append(comp_index)
 
+    # Get build params dirs packed to bundles: all dirs in project root
+    def _get_bundle_dirs(self) -> list:
+        with os.scandir(self.path) as it:
+            return sorted(entry.name for entry in it if entry.is_dir(follow_symlinks=False))
+
+    # Generates bundle path inside repository
+    def _bundle_path(self, bundle_dir: str) -> str:
+        return f"{self.project_name}-{self.version}/.bundles/{bundle_dir}{BUNDLE_FORMATS[self.bundle]}"
+
+    # Handle bundle: submits bundle upload to pool if merge option allows it
+    def _handle_bundle(self, bundle_dir: str, pool: ThreadPoolExecutor, uploads: list, checksum: str | None = None) -> None:
+        comp_path = self._bundle_path(bundle_dir)
+        if self._handle_merge(self.components.get(comp_path), comp_path, checksum):
+            uploads.append((f"{bundle_dir} bundle", comp_path, self._submit_upload(pool, self._send_bundle_request, f"{self.path}/{bundle_dir}", comp_path)))
+
+    # Submits upload to pool & tracks it in progress
+    def _submit_upload(self, pool: ThreadPoolExecutor, fn, *args):
+        future = pool.submit(fn, *args)
+        self.progress.add_total()
+        future.add_done_callback(self.progress.file_done)
+        return future
+
+    # Uploads bundle of given dir as single tar archive, streamed through pipe while it's being packed
+    # Returns ("" if uploaded else error message, checksum, size)
+    # Archive body can't be resent, so request is sent w/o urllib3 retries & failed attempts re-pack archive
+    def _send_bundle_request(self, bundle_dir: str, comp_path: str) -> tuple:
+        for attempt in range(CONFIG_DATA["RETRIES"] + 1):
+            if attempt != 0:
+                time.sleep(CONFIG_DATA["BACKOFF_FACTOR"] * 2 ** attempt)
+            try:
+                error, checksum, size, retry = self._send_bundle_attempt(bundle_dir, comp_path)
+            except Exception as e:
+                # Connection errors are retried, packing errors are returned by attempt as final
+                error, checksum, size, retry = str(e), None, None, True
+            if not retry:
+                break
+        return error, checksum, size
+
+    # Packs & uploads bundle once
+    # Returns (error, checksum, size, True if failure is worth retrying)
+    def _send_bundle_attempt(self, bundle_dir: str, comp_path: str) -> tuple:
+        read_fd, write_fd = os.pipe()
+        writer_errors = []
+        writer = threading.Thread(target=self._write_bundle, args=(write_fd, bundle_dir, writer_errors), daemon=True)
+        writer.start()
+        reader = HashingReader(os.fdopen(read_fd, "rb"))
+        # Failed packing interrupts request, so broken archive is not stored
+        def body():
+            for chunk in iter(lambda: reader.read(CONFIG_DATA["CHUNK_SIZE"]), b""):
+                yield chunk
+            writer.join()
+            if len(writer_errors) != 0:
+                raise writer_errors[0]
+        try:
+            with self.client.phase("upload"):
+                r = self.client.put(f"/repository/{self.project_name}/{comp_path}", data=body(), retry=False)
+        except Exception:
+            if len(writer_errors) != 0:
+                return str(writer_errors[0]), None, None, False
+            raise
+        finally:
+            # Closed pipe unblocks writer if request failed before whole archive was sent
+            reader.close()
+            writer.join()
+        if len(writer_errors) != 0:
+            return str(writer_errors[0]), None, None, False
+        if not r.ok:
+            return f"Status code {r.status_code}\n{r.text}", None, None, r.status_code in RETRY_STATUSES
+        self.progress.add_bytes(reader.size)
+        return "", reader.checksum.hexdigest(), reader.size, False
+
+    # Packs bundle to pipe
+    def _write_bundle(self, write_fd: int, bundle_dir: str, errors: list) -> None:
+        try:
+            with os.fdopen(write_fd, "wb") as f:
+                write_bundle(f, bundle_dir, self.bundle)
+        except BrokenPipeError:
+            pass
+        except Exception as e:
+            errors.append(e)
+
+    # Gets checksum of bundle archive by packing it to hashing sink, None if packing failed (upload reports error then)
+    def _hash_bundle(self, bundle_dir: str) -> str | None:
+        writer = HashingWriter()
+        with self.client.phase("hashing"):
+            try:
+                write_bundle(writer, bundle_dir, self.bundle)
+            except OSError:
+                return None
+        return writer.checksum.hexdigest()
+
+    # Waits for uploads, logs results & updates components index
+    def _finish_uploads(self, uploads: list) -> None:
+        for endpoint, comp_path, future in uploads:
+            try:
+                error, checksum, size = future.result()
+            except Exception as e:
+                error = str(e)
+            if error != "":
+                self.errors.append((endpoint, error))
+                self.client.count("failed")
+                continue
+            log("Uploaded component", endpoint, level=VERBOSE)
+            self.client.count("uploaded")
+            comp = self.components.get(comp_path)
+            self.components[comp_path] = {"id": comp["id"] if comp else None, "sha1": checksum, "size": size}
+
+    # Logs summary of failed uploads
+    def _report_errors(self) -> None:
+        if len(self.errors) == 0:
+            return
+        log(f"[!] {len(self.errors)} component(s) failed:", level=ERROR)
+        for endpoint, error in self.errors:
+            log(f"    {endpoint}: {error}", level=ERROR)
+
     # Handle merge logic & user questions
-    def _handle_merge(self, comp_id: str | None, comp_name: str | None) -> bool:
-        if  (self.merge == MergeOptions.manual and comp_id == None) or \
+    def _handle_merge(self, comp: dict | None, comp_name: str | None, checksum: str | None = None) -> bool:
+        if  (self.merge == MergeOptions.manual and comp == None) or \
              self.merge == MergeOptions.replace or \
              self.merge == MergeOptions.overwrite or \
-            (self.merge == MergeOptions.append and comp_id == None):
+            (self.merge == MergeOptions.append and comp == None) or \
+            (self.merge == MergeOptions.sync and (comp == None or comp["sha1"] != checksum)):
             return True
         elif self.merge == MergeOptions.manual:
             tmp = input_loop(f"Overwrite {comp_name}?[y/o/a/N]\n", ("y", "o", "a", "N"))
@@ -326,24 +1642,45 @@ class NexusRawUpload():
         else:
             return False
 
-    # Get component from repository
-    def _get_component_id(self, endpoint: str) -> str | None:
-        comp_path = f"{self.project_name}-{self.version}/{self.project_name}/{endpoint}"
-        r = requests.get(f"{CONFIG_DATA['SERVER_URI']}/service/rest/v1/components?repository={self.project_name}", auth=self.auth)
-        if r.ok:
-            for item in r.json()["items"]:
-                if item["name"] == comp_path:
-                    return item["id"]
-        return None
-        
-    # Uploads component to provided repository
-    def _send_upload_request(self, upload_from: str, endpoint: str):
-        log("Uploading component", endpoint)
+    # Generates component path inside repository
+    def _component_path(self, endpoint: str) -> str:
+        return f"{self.project_name}-{self.version}/{self.project_name}/{endpoint}"
+
+    # Get component from components index
+    def _get_component(self, endpoint: str) -> dict | None:
+        return self.components.get(self._component_path(endpoint))
+
+    # Uploads component, checksum for version manifest is computed first if it's not known yet
+    # Returns ("" if uploaded else error message, checksum, size)
+    def _upload_component(self, upload_from: str, endpoint: str) -> tuple:
+        with self.client.phase("upload"):
+            error, checksum, size = self._send_upload_request(upload_from, endpoint)
+        if error == "":
+            self.progress.add_bytes(size)
+        return error, checksum, size
+
+    def _hash_component(self, path: str) -> str:
+        with self.client.phase("hashing"):
+            return file_sha1(path)
+
+    # Uploads component to provided repository, file body is streamed from disk & hashed while it's sent,
+    # so file is read once & checksum matches uploaded data
+    # Content-Length is set explicitly, so body is never sent w/ chunked encoding
+    # Returns ("" if uploaded else error message, checksum, size)
+    def _send_upload_request(self, upload_from: str, endpoint: str) -> tuple:
         with open(upload_from, 'rb') as f:
-            data = f.read()
-        r = requests.put(f"{CONFIG_DATA['SERVER_URI']}/repository/{self.project_name}/{self.project_name}-{self.version}/{self.project_name}/{endpoint}", data=data, auth=self.auth)
+            size = os.fstat(f.fileno()).st_size
+            reader = HashingReader(f)
+            r = self.client.put(
+                f"/repository/{self.project_name}/{self._component_path(endpoint)}",
+                data=reader if size != 0 else b"",
+                headers={"Content-Length": str(size)}
+            )
         if not r.ok:
-            log(f"Upload failed: Status code {r.status_code}\n{r.text}")
+            return f"Status code {r.status_code}\n{r.text}", None, None
+        if reader.size != size:
+            return f"File changed while uploading: expected {size} bytes, sent {reader.size}", None, None
+        return "", reader.checksum.hexdigest(), size
 
     # Generates file with all symlinks data
     def _generate_metadata_file(self, symlinks: list, components: list) -> bytes:
@@ -352,43 +1689,162 @@ class NexusRawUpload():
             text += f"   {components[i][1]} {os.readlink(components[i][0])}\n"
         return str.encode(text)
     
-    # Sends metadata file
-    def _send_metadata_file(self, data: bytes) -> None:
-        r = requests.put(f"{CONFIG_DATA['SERVER_URI']}/repository/{self.project_name}/{self.project_name}-{self.version}/.metadata", auth=self.auth, data=data)
+    # Generates version manifest from components index: all version files & bundles w/ their size, sha1 & build params
+    # {"metadata": sha1, "files": [{"path": ..., "size": ..., "sha1": ..., "target": platform-architecture-target}, ...]}
+    def _generate_manifest_file(self, metadata: bytes) -> bytes:
+        files = []
+        for comp_path, comp in sorted(self.components.items()):
+            if comp["sha1"] == None:
+                continue
+            if comp_path.startswith(f"{self.project_name}-{self.version}/{self.project_name}/"):
+                files.append({"path": comp_path, "size": comp["size"], "sha1": comp["sha1"], "target": comp_path.split("/")[2]})
+            elif comp_path.startswith(f"{self.project_name}-{self.version}/.bundles/"):
+                files.append({"path": comp_path, "size": comp["size"], "sha1": comp["sha1"], "target": bundle_target(comp_path.split("/")[2])})
+        return json.dumps({"metadata": sha1(metadata).hexdigest(), "files": files}).encode()
+
+    # Sends version service file: .metadata or .manifest
+    def _send_version_file(self, filename: str, data: bytes) -> None:
+        r = self.client.put(f"/repository/{self.project_name}/{self.project_name}-{self.version}/{filename}", data=data)
         if not r.ok:
-            log(f"Metadata upload failed: Status code {r.status_code}\n{r.text}")
+            log(f"{filename} upload failed: Status code {r.status_code}\n{r.text}", level=ERROR)
     
-    # Sends delete component request
-    def _delete_comp(self, comp_id: str, comp_path: str) -> None:
-        r = requests.delete(f"{CONFIG_DATA['SERVER_URI']}/service/rest/v1/components/{comp_id}", auth=self.auth)
-        log(f"Removed component {comp_path}")
+    # Sends delete component request, already removed component is not an error
+    # Returns "" if removed, else error message
+    def _delete_comp(self, comp_id: str, comp_path: str) -> str:
+        with self.client.phase("delete"):
+            r = self.client.delete(f"/service/rest/v1/components/{comp_id}")
+        if not r.ok and r.status_code != 404:
+            return f"Status code {r.status_code}"
+        self.client.count("deleted")
+        return ""
 
-    # Uploads components one by one
-    def start(self) -> None:
-        if self.merge == 1:
+    # Submits delete requests to pool
+    # [(comp_id1, comp_path1, future1), ...]
+    def _submit_deletions(self, remove_comps: list, pool: ThreadPoolExecutor) -> list:
+        return [(comp[0], comp[1], pool.submit(self._delete_comp, comp[0], comp[1])) for comp in remove_comps]
+
+    # Waits for delete requests, failed ones are resubmitted up to DELETE_ATTEMPTS times
+    # Logs results & updates components index
+    def _finish_deletions(self, deletions: list, pool: ThreadPoolExecutor) -> None:
+        for attempt in range(1, DELETE_ATTEMPTS + 1):
+            failed = []
+            for comp_id, comp_path, future in deletions:
+                try:
+                    error = future.result()
+                except Exception as e:
+                    error = str(e)
+                if error != "":
+                    failed.append((comp_id, comp_path, error))
+                    continue
+                self.components.pop(comp_path, None)
+                log(f"Removed component {comp_path}", level=VERBOSE)
+            if len(failed) == 0 or attempt == DELETE_ATTEMPTS:
+                break
+            time.sleep(CONFIG_DATA["BACKOFF_FACTOR"] * 2 ** attempt)
+            deletions = self._submit_deletions(failed, pool)
+        for comp_id, comp_path, error in failed:
+            self.errors.append((comp_path, f"Remove failed: {error}"))
+
+    # Starts removing old components:
+    # replace -> all version components, sync w/ prune -> components which no longer exist locally
+    # Components which will be uploaded again are removed before uploads, others are removed along w/ uploads
+    # Returns deletions to be finished after uploads
+    def _start_deletions(self, components: list, bundle_dirs: list, pool: ThreadPoolExecutor) -> list:
+        if self.merge == MergeOptions.replace:
             remove_comps = self._get_delete_rep()
-            if len(remove_comps) != 0:
-                log(f"Removing old {self.project_name}-{self.version}...")
-                for comp in remove_comps:
-                    self._delete_comp(comp[0], comp[1])
-                log(f"Successfully removed old {self.project_name}-{self.version}")
-        components = self._get_all_components()
+        elif self.prune:
+            remove_comps = self._get_prune_rep(components, bundle_dirs)
+        else:
+            return []
+        if len(remove_comps) == 0:
+            return []
+        log(f"Removing old {self.project_name}-{self.version} components...")
+        local_paths = self._get_local_paths(components, bundle_dirs)
+        self._finish_deletions(self._submit_deletions([comp for comp in remove_comps if comp[1] in local_paths], pool), pool)
+        return self._submit_deletions([comp for comp in remove_comps if comp[1] not in local_paths], pool)
+
+    # Get repository paths of local files & bundles
+    def _get_local_paths(self, components: list, bundle_dirs: list) -> set:
+        local_paths = {self._component_path(comp[1]) for comp in components if not os.path.islink(comp[0])}
+        local_paths.update(self._bundle_path(bundle_dir) for bundle_dir in bundle_dirs)
+        return local_paths
+
+    # Get repository components & bundles which no longer exist locally
+    def _get_prune_rep(self, components: list, bundle_dirs: list) -> list:
+        local_paths = self._get_local_paths(components, bundle_dirs)
+        return [
+            (comp["id"], comp_path) for comp_path, comp in self.components.items()
+            if comp_path.startswith((f"{self.project_name}-{self.version}/{self.project_name}/", f"{self.project_name}-{self.version}/.bundles/")) and \
+                comp_path not in local_paths and comp["id"] != None
+        ]
+
+    # Uploads components w/ pool of self.jobs workers
+    def start(self) -> None:
+        try:
+            with self.client.phase("listing"):
+                self.components = self._build_components_index()
+        except ListingError as e:
+            self.errors.append((f"{self.project_name}-{self.version}", str(e)))
+            self._report_errors()
+            return
+        with self.client.phase("discovery"):
+            components = self._get_all_components()
+        bundle_dirs = []
+        if self.bundle != None:
+            bundle_dirs = self._get_bundle_dirs()
+            components = [comp for comp in components if comp[1].split("/")[0] not in bundle_dirs]
         symlinks = []
-        log(f"Uploading {self.project_name}-{self.version}...")
-        for _ in range(len(components)):
-            self._handle_component(components[_], symlinks, _)
-        log(f"Uploading metadata file...")
-        self._send_metadata_file(self._generate_metadata_file(symlinks, components))
+        uploads = []
+        from concurrent.futures import ThreadPoolExecutor
+        LOGGER.start_progress(self.progress)
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            deletions = self._start_deletions(components, bundle_dirs, pool)
+            log(f"Uploading {self.project_name}-{self.version}...")
+            # Local files are hashed in parallel to compare w/ repository checksums
+            checksums = {}
+            if self.merge == MergeOptions.sync:
+                checksums = {comp[1]: pool.submit(self._hash_component, comp[0]) for comp in components if not os.path.islink(comp[0])}
+            for _ in range(len(components)):
+                checksum = checksums[components[_][1]].result() if components[_][1] in checksums else None
+                self._handle_component(components[_], symlinks, _, pool, uploads, checksum)
+            # Bundles existing in repository are packed w/o upload to compare checksums of reproducible archives
+            bundle_checksums = {}
+            if self.merge == MergeOptions.sync:
+                bundle_checksums = {bundle_dir: pool.submit(self._hash_bundle, f"{self.path}/{bundle_dir}") for bundle_dir in bundle_dirs if self._bundle_path(bundle_dir) in self.components}
+            for bundle_dir in bundle_dirs:
+                checksum = bundle_checksums[bundle_dir].result() if bundle_dir in bundle_checksums else None
+                self._handle_bundle(bundle_dir, pool, uploads, checksum)
+            self._finish_uploads(uploads)
+            self._finish_deletions(deletions, pool)
+        LOGGER.finish_progress()
+        if self.progress.total != 0:
+            self.progress.summary()
+        skipped = len(components) + len(bundle_dirs) - len(symlinks) - len(uploads)
+        if skipped != 0:
+            log(f"Skipped {skipped} existing/unchanged component(s)")
+            self.client.count("skipped", skipped)
+        log(f"Uploading metadata & manifest files...")
+        with self.client.phase("version files"):
+            metadata = self._generate_metadata_file(symlinks, components)
+            self._send_version_file(".metadata", metadata)
+            self._send_version_file(".manifest", self._generate_manifest_file(metadata))
+        if len(self.errors) != 0:
+            self._report_errors()
+            return
         log(f"Successfully uploaded {self.project_name}-{self.version}")
+        LOGGER.flush()
 
 
 def check_arguments(args):
     if not args.command:
-        print("Error, provide one of following commands: download, upload, config")
+        print("Error, provide one of following commands: download, upload, config, cache")
         exit(1)
-    if not args.auth and CONFIG_DATA["AUTH"] == "" and (args.command != "config" and not args.print):
+    if args.command in ("download", "upload") and not args.auth and CONFIG_DATA["AUTH"] == "":
         print("Error, provide auth credentials or update config")
         exit(1)
+    if args.command in ("download", "upload") and args.jobs < 1:
+        print("Error, --jobs must be positive number")
+        exit(1)
     if args.command == "upload":
         if not args.version:
             print("Error, provide version tag using --version")
@@ -396,10 +1852,54 @@ def check_arguments(args):
         if not args.path:
             print("Error, provide path to project using --path")
             exit(1)
+        if args.prune and args.merge != "sync":
+            print("Error, --prune can be used only w/ --merge sync")
+            exit(1)
+        if args.bundle == "zst" and import_zstandard() == None:
+            print("Error, zst bundles require zstandard package (pip install zstandard)")
+            exit(1)
     elif args.command == "config":
-        if not args.auth and not args.server and not args.print:
-            print("Error, provide new auth (--auth) or new server uri (--server)")
+        if not args.auth and not args.server and args.cache_dir == None and args.cache_size == None and not args.cache_link and not args.print:
+            print("Error, provide new auth (--auth), server uri (--server) or cache settings (--cache-dir, --cache-size, --cache-link)")
+            exit(1)
+    elif args.command == "cache":
+        if not CONFIG_DATA["CACHE_DIR"]:
+            print("Error, artifacts cache is disabled; Set it up using config --cache-dir")
             exit(1)
+        if args.max_size != None and args.max_size < 0:
+            print("Error, --max-size must be non-negative number")
+            exit(1)
+
+def add_output_arguments(parser) -> None:
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("-q", "--quiet", help="Logs errors only.", required=False, action="store_true")
+    group.add_argument("--verbose", help="Logs every component instead of progress line.", required=False, action="store_true")
+
+def set_log_level(args) -> None:
+    LOGGER.level = ERROR if args.quiet else VERBOSE if args.verbose else INFO
+
+def add_stats_arguments(parser) -> None:
+    parser.add_argument("--stats", help="Prints requests & phases statistics after run.", required=False, action="store_true")
+    parser.add_argument("--trace", help="Writes statistics w/ every request & phase span to JSON file.", metavar="FILE", type=str, required=False, default="")
+    parser.add_argument("--prometheus", help="Writes statistics to Prometheus textfile.", metavar="FILE", type=str, required=False, default="")
+
+# Creates run instrumentation if any statistics output is requested
+def get_stats(args) -> RunStats | None:
+    if not args.stats and not args.trace and not args.prometheus:
+        return None
+    return RunStats(args.command)
+
+def export_stats(stats: RunStats | None, args) -> None:
+    if stats == None:
+        return
+    stats.finish()
+    if args.stats:
+        LOGGER.flush()
+        stats.print_summary()
+    if args.trace:
+        stats.write_trace(args.trace)
+    if args.prometheus:
+        stats.write_prometheus(args.prometheus)
 
 def get_arguments():
     main_parser = ArgumentParser(description="Script for download & upload binary dependencies.")
@@ -409,7 +1909,12 @@ def get_arguments():
     upload_parser.add_argument("-a", "--auth", help="Nexus user credentials.", metavar="USER:PASSWORD", type=str, required=False, default="")
     upload_parser.add_argument("-v", "--version", help="Version tag.", type=str, required=True)
     upload_parser.add_argument("-p", "--path", help="Path to project that will be uploaded.", type=str, required=True)
-    upload_parser.add_argument("-m", "--merge", help="Merge argument.", type=str, required=False, choices=["manual", "replace", "overwrite", "append"], default="manual")
+    upload_parser.add_argument("-m", "--merge", help="Merge argument.", type=str, required=False, choices=["manual", "replace", "overwrite", "append", "sync"], default="manual")
+    upload_parser.add_argument("-j", "--jobs", help="Number of concurrent uploads.", type=int, required=False, default=1)
+    upload_parser.add_argument("--prune", help="Removes components which no longer exist locally (sync merge only).", required=False, action="store_true")
+    add_stats_arguments(upload_parser)
+    add_output_arguments(upload_parser)
+    upload_parser.add_argument("-b", "--bundle", help="Packs every build params dir to single archive w/ given compression.", type=str, required=False, choices=list(BUNDLE_FORMATS), default=None)
 
     download_parser = sub_parsers.add_parser("download", help="Download projects from Nexus repositories")
     download_parser.add_argument("-a", "--auth", help="Nexus user credentials.", metavar="USER:PASSWORD", type=str, required=False, default="")
@@ -418,17 +1923,33 @@ def get_arguments():
     download_parser.add_argument("-t", "--target", help="Download target filter.", type=str, required=False, default="")
     download_parser.add_argument("-r", "--recursive", help="Do recursive download.", required=False, action="store_true")
     download_parser.add_argument("-f", "--force", help="Replaces all files when downloading.", required=False, action="store_true")
+    download_parser.add_argument("-j", "--jobs", help="Number of concurrent downloads.", type=int, required=False, default=1)
+    download_parser.add_argument("--verify", help="Rehashes all existing files instead of trusting manifest.", required=False, action="store_true")
+    download_parser.add_argument("--no-fsync", help="Skips syncing downloaded files to disk.", required=False, action="store_true")
+    download_parser.add_argument("-i", "--ignore", help="Glob of dirs skipped by recursive download, can be repeated.", metavar="GLOB", type=str, required=False, action="append", default=[])
+    add_stats_arguments(download_parser)
+    add_output_arguments(download_parser)
 
     config_parser = sub_parsers.add_parser("config", help="Configure settings")
     config_parser.add_argument("-a", "--auth", help="Configure auth credentials.", metavar="USER:PASSWORD", type=str, required=False, default="")
     config_parser.add_argument("-s", "--server", help="Configure server uri.", type=str, required=False, default="")
+    config_parser.add_argument("-c", "--cache-dir", help="Configure shared artifacts cache dir, empty string disables cache.", type=str, required=False, default=None)
+    config_parser.add_argument("--cache-size", help="Configure artifacts cache size limit in bytes.", type=int, required=False, default=None)
+    config_parser.add_argument("--cache-link", help="Configure how cached artifacts are placed to workspaces.", type=str, required=False, choices=CACHE_LINK_MODES, default="")
     config_parser.add_argument("-p", "--print", help="Prints current config settings.", required=False, action="store_true")
+
+    cache_parser = sub_parsers.add_parser("cache", help="Manage shared artifacts cache")
+    cache_parser.add_argument("action", help="Cache action: print statistics or evict least recently used artifacts.", type=str, choices=["stats", "prune"])
+    cache_parser.add_argument("-s", "--max-size", help="Size in bytes cache is pruned to, CACHE_SIZE_LIMIT by default.", type=int, required=False, default=None)
     return main_parser.parse_args()
 
 def main() -> None:
     args = get_arguments()
+    load_config()
     check_arguments(args)
     if args.command == "download":
+        set_log_level(args)
+        stats = get_stats(args)
         user_val = args.auth.split(":")[0] if args.auth else CONFIG_DATA["AUTH"].split(":")[0]
         pass_val = args.auth.split(":")[1] if args.auth else CONFIG_DATA["AUTH"].split(":")[1]
         platform = args.platform if len(args.platform.split("-")) == 1 else "-".join(args.platform.split("-")[:-1])
@@ -438,13 +1959,23 @@ def main() -> None:
             password=pass_val,
             filter_options=(platform, architecture, args.target),
             config_path=args.external_config,
-            force_download=args.force
+            force_download=args.force,
+            jobs=args.jobs,
+            verify=args.verify,
+            fsync=not args.no_fsync,
+            ignore=args.ignore,
+            stats=stats
         )
         if args.recursive:
             p.start_recursive()
         else:
             p.start()
+        export_stats(stats, args)
+        if len(p.errors) != 0:
+            exit(1)
     elif args.command == "upload":
+        set_log_level(args)
+        stats = get_stats(args)
         user_val = args.auth.split(":")[0] if args.auth else CONFIG_DATA["AUTH"].split(":")[0]
         pass_val = args.auth.split(":")[1] if args.auth else CONFIG_DATA["AUTH"].split(":")[1]
         p = NexusRawUpload(
@@ -452,16 +1983,36 @@ def main() -> None:
             password=pass_val,
             path=args.path,
             version=args.version,
-            merge=args.merge
+            merge=args.merge,
+            jobs=args.jobs,
+            prune=args.prune,
+            bundle=args.bundle,
+            stats=stats
         )
         p.start()
+        export_stats(stats, args)
+        if len(p.errors) != 0:
+            exit(1)
     elif args.command == "config":
         if args.auth:
             update_config("AUTH", args.auth)
         if args.server:
             update_config("SERVER_URI", args.server)
+        if args.cache_dir != None:
+            update_config("CACHE_DIR", args.cache_dir)
+        if args.cache_size != None:
+            update_config("CACHE_SIZE_LIMIT", args.cache_size)
+        if args.cache_link:
+            update_config("CACHE_LINK", args.cache_link)
         if args.print:
             print_config()
+    elif args.command == "cache":
+        cache = ArtifactCache.from_config()
+        if args.action == "prune":
+            evicted, freed = cache.prune(args.max_size)
+            log(f"Evicted {evicted} artifact(s), {format_size(freed)} freed")
+        count, size = cache.stats()
+        print(f"Cache dir: {cache.path}\nArtifacts: {count}\nSize: {format_size(size)} of {format_size(cache.size_limit)}")
 
 if __name__ == "__main__":
     main()